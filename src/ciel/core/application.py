@@ -1,6 +1,38 @@
-from .dependency_injection import Container
+import asyncio
+import time
+from .dependency_injection import Container, Injector
 from pathlib import Path
+from typing import Any, Callable, Optional
 from .module import ModuleRegister, Module
+from .module.discovery import discover
+from .module.lazy import LazyModule, contract_name
+from .util import tracing
+from ciel.asgi.typing import ASGI3Application, ASGIReceiveCallable, ASGISendCallable, Scope
+
+
+Middleware = Callable[[ASGI3Application], ASGI3Application]
+
+
+async def not_found(scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": 404,
+        "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+        "trailers": False
+    })
+    await send({
+        "type": "http.response.body",
+        "body": b"Not Found",
+        "more_body": False,
+    })
+
+
+async def reject_websocket(scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+    await send({
+        "type": "websocket.close",
+        "code": 1000,
+        "reason": None,
+    })
 
 
 class Application(Container, ModuleRegister):
@@ -10,16 +42,309 @@ class Application(Container, ModuleRegister):
         self[Application] = self
 
         for mod in self.modules:
-            mod.register(self)
+            with tracing.span(mod.manifest.name, "register"):
+                mod.register(self)
 
-    def _boot(self) -> None:
-        for mod in self.modules:
-            (self ^ mod.boot)()
+    async def _run_hook(self, mod: Module, hook: str, injector: Injector[Any], threaded: bool,
+                        timings: Optional[dict[str, float]]) -> None:
+        start = time.perf_counter()
+        with tracing.span(mod.manifest.name, hook):
+            if injector.plan(0, ()).asynchronous:
+                await injector.call_async()
+            elif threaded:
+                await asyncio.to_thread(injector)
+            else:
+                injector()
+        if timings is not None:
+            timings[mod.manifest.name] = time.perf_counter() - start
+
+    async def _run_hooks(self, hook: str, reverse: bool = False, timings: Optional[dict[str, float]] = None) -> None:
+        """Call a hook of every module layer by layer; coroutines and `threaded` modules' hooks run concurrently."""
+        for layer in (reversed(self.layers) if reverse else self.layers):
+            injectors = [self ^ getattr(mod, hook) for mod in layer]
+            threaded = sum(mod.threaded and not injector.plan(0, ()).asynchronous
+                           for mod, injector in zip(layer, injectors)) > 1
+            tasks = [
+                asyncio.create_task(self._run_hook(mod, hook, injector, threaded and mod.threaded, timings))
+                for mod, injector in zip(layer, injectors)
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
-    def __init__(self, base_path: Path, modules: list[Module]) -> None:
+    async def _boot(self) -> None:
+        await self._run_hooks("boot", timings=self.boot_timings)
+
+    def __init__(self, base_path: Path, modules: list[Module], resolution_cache: Optional[Path] = None,
+                 discover_modules: bool = True) -> None:
+        """Modules under `base_path/modules` are discovered, unless `discover_modules` is false."""
+        self.tracer: Optional[tracing.Tracer] = tracing.start(base_path)
         self.base_path: Path = base_path
+        self.booted: bool = False
+        self.booting: Optional[asyncio.Task[None]] = None
+        self.boot_timings: dict[str, float] = {}
+        self.asgi_handlers: dict[str, ASGI3Application] = {
+            "http": not_found,
+            "websocket": reject_websocket,
+        }
+        self.asgi_middleware: list[Middleware] = []
+        self.lazy_contracts: dict[str, LazyModule] = {}
+        self.lazy_routes: list[LazyModule] = []
+        self.pipeline: ASGI3Application = self._cold_start
+
+        try:
+            directory = base_path / "modules"
+            if discover_modules and directory.is_dir():
+                with tracing.span("discover", "modules"):
+                    modules = [*modules, *discover(directory, base_path / ".ciel" / "modules.json")]
+
+            Container.__init__(self)
+            with tracing.span("resolve", "modules"):
+                ModuleRegister.__init__(self, modules, resolution_cache)
+
+            self._initialize_container()
+        except BaseException:
+            self.finish_trace()
+            raise
+
+    def handle(self, scope_type: str, handler: ASGI3Application) -> None:
+        """Set the ASGI application serving the connections of a scope type ("http" or "websocket")."""
+        if self.booted:
+            raise RuntimeError("Handlers can't be changed once the application is booted")
+        self.asgi_handlers[scope_type] = handler
+
+    def middleware(self, factory: Middleware) -> None:
+        """Wrap the application in an ASGI middleware; middleware added first is the outermost."""
+        if self.booted:
+            raise RuntimeError("Middleware can't be added once the application is booted")
+        self.asgi_middleware.append(factory)
+
+    def boot(self) -> None:
+        """Boot synchronously, running an event loop for asynchronous hooks unless one is already running."""
+        if self.booted:
+            return
+        hooks = [self ^ mod.boot for mod in self.modules]
+        if any(hook.plan(0, ()).asynchronous for hook in hooks):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self.startup())
+                return
+            raise RuntimeError("Asynchronous modules must be booted with `await app.startup()` inside an event loop")
+
+        try:
+            for mod, hook in zip(self.modules, hooks):
+                start = time.perf_counter()
+                with tracing.span(mod.manifest.name, "boot"):
+                    hook()
+                self.boot_timings[mod.manifest.name] = time.perf_counter() - start
+            self.booted = True
+            self.pipeline = self._build_pipeline()
+        finally:
+            self.finish_trace()
+
+    async def startup(self) -> None:
+        """Boot the modules layer by layer, then link the pipeline; concurrent calls wait for the same boot."""
+        if self.booted:
+            return
+        if self.booting is None:
+            self.booting = asyncio.ensure_future(self._boot())
+        try:
+            await asyncio.shield(self.booting)
+            if not self.booted:
+                self.booted = True
+                self.pipeline = self._build_pipeline()
+        finally:
+            self.finish_trace()
+
+    def finish_trace(self) -> None:
+        """Stop tracing the startup and write the trace, for applications that are never booted."""
+        if self.tracer is not None:
+            tracing.stop(self.tracer)
+            self.tracer = None
+
+    async def shutdown(self) -> None:
+        """Call the `shutdown` hooks of the modules, layer after layer in reverse order."""
+        if self.booted:
+            await self._run_hooks("shutdown", reverse=True)
+
+    def _build_pipeline(self) -> ASGI3Application:
+        handlers = dict(self.asgi_handlers)
+        handlers["lifespan"] = self._lifespan
+
+        async def dispatch(scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+            try:
+                handler = handlers[scope["type"]]
+            except KeyError:
+                raise ValueError(f"Unsupported ASGI scope type {scope['type']}") from None
+            await handler(scope, receive, send)
+
+        pipeline: ASGI3Application = dispatch
+        for factory in reversed(self.asgi_middleware):
+            pipeline = factory(pipeline)
+        return pipeline
+
+    def defer(self, lazy: LazyModule) -> None:
+        """Index the contracts and routes of a lazy module, which is loaded when one of them is first needed."""
+        for name in lazy.provides:
+            self.lazy_contracts[name] = lazy
+        if lazy.routes:
+            self.lazy_routes.append(lazy)
+
+    def lazy_module_providing(self, contract: Any) -> Optional[LazyModule]:
+        """Lazy module not loaded yet providing a contract."""
+        if not self.lazy_contracts:
+            return None
+        name = contract_name(contract)
+        return self.lazy_contracts.get(name) if name is not None else None
+
+    def bind_missing(self, contract: Any) -> bool:
+        lazy = self.lazy_module_providing(contract)
+        if lazy is None:
+            return False
+        self.load_module(lazy)
+        return True
+
+    def can_bind_missing(self, contract: Any) -> bool:
+        return self.lazy_module_providing(contract) is not None
+
+    async def bind_missing_async(self, contract: Any) -> bool:
+        lazy = self.lazy_module_providing(contract)
+        if lazy is None:
+            return False
+        await self.load_module_async(lazy)
+        return True
+
+    def lazy_module_for(self, path: str) -> Optional[LazyModule]:
+        """Lazy module not loaded yet serving the routes under a path."""
+        for lazy in self.lazy_routes:
+            if lazy.covers(path):
+                return lazy
+        return None
+
+    def _lazy_dependencies(self, lazy: LazyModule) -> list[LazyModule]:
+        """Lazy modules not loaded yet that a lazy module depends on, once checked that it can be loaded."""
+        if self.frozen:
+            raise RuntimeError(f"Lazy module {lazy.manifest} can't be loaded once the container is frozen")
+        return [
+            dep for dep in (self.indexed.get(d.name) for d in lazy.manifest.dependencies)
+            if isinstance(dep, LazyModule) and dep.loaded is None
+        ]
+
+    def _register_lazy(self, lazy: LazyModule) -> tuple[Module, tuple[dict[Any, Any], ...]]:
+        # The bindings before the module registers its own, restored if its registration or boot fails.
+        saved = (dict(self.bindings), dict(self.by_contract), dict(self.aliases))
+        module = lazy.load()
+        try:
+            module.register(self)
+        except BaseException:
+            self._restore_bindings(saved)
+            raise
+        return module, saved
+
+    def _restore_bindings(self, saved: tuple[dict[Any, Any], ...]) -> None:
+        bindings, by_contract, aliases = saved
+        for identifier in self.bindings.keys() - bindings.keys():
+            self.singletons.pop(identifier, None)
+        for current, previous in zip((self.bindings, self.by_contract, self.aliases), saved):
+            current.clear()
+            current.update(previous)
+        self.revision += 1
+
+    def _loaded(self, lazy: LazyModule, module: Module) -> None:
+        lazy.loaded = module
+        for name in lazy.provides:
+            self.lazy_contracts.pop(name, None)
+        if lazy in self.lazy_routes:
+            self.lazy_routes.remove(lazy)
+
+    def load_module(self, lazy: LazyModule) -> Module:
+        """Import, register and boot a lazy module and its lazy dependencies, all or nothing."""
+        if lazy.loaded is None:
+            for dependency in self._lazy_dependencies(lazy):
+                self.load_module(dependency)
+            module, saved = self._register_lazy(lazy)
+            try:
+                if lazy.boot_due:
+                    self.boot_loaded(lazy, module)
+            except BaseException:
+                self._restore_bindings(saved)
+                raise
+            self._loaded(lazy, module)
+        return lazy.loaded  # type: ignore
+
+    async def load_module_async(self, lazy: LazyModule) -> Module:
+        """Same as `load_module`, awaiting asynchronous `boot` hooks. Concurrent calls wait for the same load."""
+        if lazy.loading is None:
+            lazy.loading = asyncio.ensure_future(self._load_module_async(lazy))
+        try:
+            await asyncio.shield(lazy.loading)
+        except BaseException:
+            if lazy.loading.done():
+                # Failed: the next call tries again.
+                lazy.loading = None
+            raise
+        return lazy.loaded  # type: ignore
+
+    async def _load_module_async(self, lazy: LazyModule) -> None:
+        if lazy.loaded is not None:
+            return
+        for dependency in self._lazy_dependencies(lazy):
+            await self.load_module_async(dependency)
+        module, saved = self._register_lazy(lazy)
+        try:
+            if lazy.boot_due:
+                await self.boot_loaded_async(lazy, module)
+        except BaseException:
+            self._restore_bindings(saved)
+            raise
+        self._loaded(lazy, module)
+
+    def boot_loaded(self, lazy: LazyModule, module: Module) -> None:
+        hook = self ^ module.boot
+        if hook.plan(0, ()).asynchronous:
+            raise RuntimeError(f"Module {lazy.manifest} boots asynchronously: load it with `load_module_async`")
+        start = time.perf_counter()
+        hook()
+        lazy.booted = True
+        self.boot_timings[lazy.manifest.name] = time.perf_counter() - start
+
+    async def boot_loaded_async(self, lazy: LazyModule, module: Module) -> None:
+        start = time.perf_counter()
+        await (self ^ module.boot).call_async()
+        lazy.booted = True
+        self.boot_timings[lazy.manifest.name] = time.perf_counter() - start
+
+    async def _cold_start(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        # Servers without lifespan support: boot on the first connection.
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+            return
+        await self.startup()
+        await self.pipeline(scope, receive, send)
 
-        Container.__init__(self)
-        ModuleRegister.__init__(self, modules)
+    async def _lifespan(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        while True:
+            event = await receive()
+            if event["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": repr(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif event["type"] == "lifespan.shutdown":
+                try:
+                    await self.shutdown()
+                except Exception as e:
+                    await send({"type": "lifespan.shutdown.failed", "message": repr(e)})
+                    return
+                await send({"type": "lifespan.shutdown.complete"})
+                return
 
-        self._initialize_container()
+    async def __call__(self, scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        await self.pipeline(scope, receive, send)
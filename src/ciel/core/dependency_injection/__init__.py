@@ -1,7 +1,10 @@
-from .container import Container
+from .container import Container, Lifetime
 from .injector import Injector
+from .scope import Scope
 
 __all__ = [
     'Container',
-    'Injector'
+    'Injector',
+    'Lifetime',
+    'Scope',
 ]
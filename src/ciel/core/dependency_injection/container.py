@@ -1,18 +1,46 @@
-from typing import Callable, Any, Optional, TypeVar, Generic
+import asyncio
+from asyncio import Future
+from concurrent.futures import Executor
+from enum import Enum
+from functools import partial
+from itertools import repeat
+from threading import RLock
+from typing import Awaitable, Callable, Any, ClassVar, Optional, TypeVar, Generic
+from weakref import WeakKeyDictionary, ref
+from .graph import DependencyGraph
 from .injector import Injector
+from .scope import CURRENT_SCOPE, Scope
+from ..util import tracing
 
 T = TypeVar("T")
 
+MISSING: Any = object()
+
 
 class BindingIdentifier(Generic[T]):
+    interned: ClassVar[WeakKeyDictionary[type, "BindingIdentifier[Any]"]] = WeakKeyDictionary()
+
+    @classmethod
+    def of(cls, contract: type[T]) -> "BindingIdentifier[T]":
+        try:
+            return cls.interned[contract]
+        except KeyError:
+            res = cls.interned[contract] = cls(contract)
+            return res
 
     @staticmethod
     def gen_name(contract: type) -> str:
         return f"{contract.__module__}.{contract.__qualname__}"
 
     def __init__(self, contract: type[T]):
-        self.contract = contract
+        # Held weakly so that interned identifiers do not keep their contract alive.
+        self.reference: ref[type[T]] = ref(contract)
         self.name = BindingIdentifier.gen_name(contract)
+        self.hash = hash(self.name)
+
+    @property
+    def contract(self) -> Optional[type[T]]:
+        return self.reference()
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, BindingIdentifier):
@@ -20,94 +48,311 @@ class BindingIdentifier(Generic[T]):
         return self.name == other.name
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self.hash
+
+
+class Lifetime(Enum):
+    TRANSIENT = "transient"
+    SINGLETON = "singleton"
+    SCOPED = "scoped"
 
 
 class Binding(Generic[T]):
 
     def __init__(self, container: "Container", contract: type[T], builder: Optional[Callable[..., T]],
-                 singleton: bool = False) -> None:
+                 lifetime: Lifetime = Lifetime.TRANSIENT) -> None:
         if builder is None:
             builder = contract
 
         self.contract: type = contract
-        self.id: BindingIdentifier[T] = BindingIdentifier(contract)
+        self.id: BindingIdentifier[T] = BindingIdentifier.of(contract)
         self.builder: Injector[T] = container ^ builder
-        self.singleton: bool = singleton
+        self.lifetime: Lifetime = lifetime
+        self.singleton: bool = lifetime is Lifetime.SINGLETON
+        self.scoped: bool = lifetime is Lifetime.SCOPED
+        self.lock: RLock = RLock()
 
     def __call__(self, *args: Any, **kwargs: Any) -> T:
+        if self.builder.coroutine:
+            raise TypeError(f"{self.id.name} has an asynchronous builder, use make_async")
+        if tracing.current is not None:
+            with tracing.current.span(self.id.name, "binding"):
+                return self.builder(*args, **kwargs)
         return self.builder(*args, **kwargs)
 
+    async def build_async(self, *args: Any, **kwargs: Any) -> T:
+        if tracing.current is not None:
+            with tracing.current.span(self.id.name, "binding"):
+                return await self.builder.call_async(*args, **kwargs)
+        return await self.builder.call_async(*args, **kwargs)
+
 
 class Container:
     def __init__(self) -> None:
         self.bindings: dict[BindingIdentifier[Any], Binding[Any]] = dict()
         self.singletons: dict[BindingIdentifier[Any], Any] = dict()
+        self.building: dict[BindingIdentifier[Any], Future[Any]] = dict()
         self.aliases: dict[str, BindingIdentifier[Any]] = dict()
+        self.by_contract: dict[type, Binding[Any]] = dict()
+        self.revision: int = 0
+        self.frozen: bool = False
+        self.table: dict[Any, Callable[[], Any]] = dict()
 
     def transient(
             self,
             contract: type[T],
             builder: Optional[Callable[..., T]] = None,
             aliases: Optional[list[str]] = None) -> None:
-        self._bind(contract, builder, aliases, False)
+        self._bind(contract, builder, aliases, Lifetime.TRANSIENT)
 
     def singleton(self, contract: type[T], builder: Optional[Callable[..., T]] = None,
                   aliases: Optional[list[str]] = None) -> None:
-        self._bind(contract, builder, aliases, True)
+        self._bind(contract, builder, aliases, Lifetime.SINGLETON)
+
+    def scoped(self, contract: type[T], builder: Optional[Callable[..., T]] = None,
+               aliases: Optional[list[str]] = None) -> None:
+        self._bind(contract, builder, aliases, Lifetime.SCOPED)
 
     def _bind(self, contract: type[T], builder: Optional[Callable[..., T]], aliases: Optional[list[str]],
-              singleton: bool) -> None:
-        res = Binding(self, contract, builder, singleton)
+              lifetime: Lifetime) -> None:
+        if self.frozen:
+            raise RuntimeError(f"Can't bind {BindingIdentifier.gen_name(contract)}, the container is frozen")
+        res = Binding(self, contract, builder, lifetime)
+        previous = self.bindings.get(res.id)
+        if previous is not None:
+            del self.by_contract[previous.contract]
         self.bindings[res.id] = res
+        self.by_contract[contract] = res
         if aliases is not None:
             for alias in aliases:
                 self.aliases[alias] = res.id
+        self.revision += 1
 
-    def get_binding(self, contract: BindingIdentifier[T] | type[T] | str) -> Binding[T]:
+    def identify(self, contract: BindingIdentifier[T] | type[T] | str) -> BindingIdentifier[T]:
         if isinstance(contract, str):
             if contract in self.aliases:
-                bind_id = self.aliases[contract]
-            else:
-                raise KeyError(contract)
-        elif isinstance(contract, type):
-            bind_id = BindingIdentifier(contract)
-        else:
-            bind_id = contract
+                return self.aliases[contract]
+            raise KeyError(contract)
+        if isinstance(contract, type):
+            return BindingIdentifier.of(contract)
+        return contract
 
-        if bind_id not in self.bindings:
-            raise KeyError(bind_id.name)
+    def get_binding(self, contract: BindingIdentifier[T] | type[T] | str) -> Binding[T]:
+        binding = self.by_contract.get(contract)  # type: ignore
+        if binding is not None:
+            return binding
 
-        return self.bindings[bind_id]
+        try:
+            return self.bindings[self.identify(contract)]
+        except KeyError:
+            if self.bind_missing(contract):
+                return self.get_binding(contract)
+            raise KeyError(contract if isinstance(contract, str) else self.identify(contract).name) from None
 
     def is_bound(self, contract: BindingIdentifier[T] | type[T] | str) -> bool:
-        if isinstance(contract, str):
-            if contract in self.aliases:
-                bind_id = self.aliases[contract]
-            else:
-                raise KeyError(contract)
-        elif isinstance(contract, type):
-            bind_id = BindingIdentifier(contract)
-        else:
-            bind_id = contract
+        if contract in self.by_contract:
+            return True
+        try:
+            return self.identify(contract) in self.bindings
+        except KeyError:
+            return False
+
+    def bind_missing(self, contract: BindingIdentifier[Any] | type[Any] | str) -> bool:
+        """Called when a contract isn't bound, to bind it on demand. Returns whether it was."""
+        return False
+
+    def can_bind_missing(self, contract: BindingIdentifier[Any] | type[Any] | str) -> bool:
+        """Whether `bind_missing` would bind a contract that isn't bound, without binding it."""
+        return False
+
+    async def bind_missing_async(self, contract: BindingIdentifier[Any] | type[Any] | str) -> bool:
+        return self.bind_missing(contract)
+
+    async def get_binding_async(self, contract: BindingIdentifier[T] | type[T] | str) -> Binding[T]:
+        binding = self.by_contract.get(contract)  # type: ignore
+        if binding is not None:
+            return binding
 
-        return bind_id in self.bindings
+        try:
+            return self.bindings[self.identify(contract)]
+        except KeyError:
+            if await self.bind_missing_async(contract):
+                return self.get_binding(contract)
+            raise KeyError(contract if isinstance(contract, str) else self.identify(contract).name) from None
 
     def make(self, contract: BindingIdentifier[T] | type[T] | str, *args: Any, **kwargs: Any) -> T:
-        binding = self.get_binding(contract)
-        if binding.singleton and binding.id in self.singletons:
-            return self.singletons[binding.id]  # type: ignore
-        res = binding(*args, **kwargs)
+        if not args and not kwargs:
+            factory = self.table.get(contract)
+            if factory is not None:
+                return factory()  # type: ignore
+        return self.resolve(self.get_binding(contract), *args, **kwargs)
+
+    def scope(self) -> Scope:
+        return Scope(self)
+
+    def active_scope(self) -> Optional[Scope]:
+        scope = CURRENT_SCOPE.get()
+        while scope is not None and scope.container is not self:
+            scope = scope.parent
+        return scope
+
+    def scoped_instances(self, binding: Binding[Any]) -> dict[BindingIdentifier[Any], Any]:
+        scope = self.active_scope()
+        if scope is None:
+            raise RuntimeError(f"No active scope for scoped binding {binding.id.name}")
+        return scope.instances
+
+    def resolve(self, binding: Binding[T], *args: Any, **kwargs: Any) -> T:
+        if binding.scoped:
+            instances = self.scoped_instances(binding)
+            if binding.id in instances:
+                return instances[binding.id]  # type: ignore
+            res = instances[binding.id] = binding(*args, **kwargs)
+            return res
+        if not binding.singleton:
+            return binding(*args, **kwargs)
+
+        res = self.singletons.get(binding.id, MISSING)
+        if res is not MISSING:
+            return res  # type: ignore
+
+        # Double-checked under the binding's own lock: concurrent threads build a singleton once, without
+        # waiting on the construction of unrelated singletons.
+        with binding.lock:
+            res = self.singletons.get(binding.id, MISSING)
+            if res is MISSING:
+                res = self.singletons[binding.id] = binding(*args, **kwargs)
+                self.revision += 1
+            return res  # type: ignore
+
+    async def make_async(self, contract: BindingIdentifier[T] | type[T] | str, *args: Any, **kwargs: Any) -> T:
+        return await self.resolve_async(await self.get_binding_async(contract), *args, **kwargs)
+
+    async def resolve_async(self, binding: Binding[T], *args: Any, **kwargs: Any) -> T:
+        if binding.scoped:
+            scope = self.active_scope()
+            if scope is None:
+                raise RuntimeError(f"No active scope for scoped binding {binding.id.name}")
+            return await self.build_once(binding, scope.instances, scope.building, args, kwargs)
         if binding.singleton:
-            self.singletons[binding.id] = res
-        return res
+            return await self.build_once(binding, self.singletons, self.building, args, kwargs)
+        return await binding.build_async(*args, **kwargs)
+
+    async def build_once(self, binding: Binding[T], instances: dict[BindingIdentifier[Any], Any],
+                         building: dict[BindingIdentifier[Any], Future[Any]], args: tuple[Any, ...],
+                         kwargs: dict[str, Any]) -> T:
+        """Build a singleton or scoped instance once, in a task that a cancelled caller doesn't cancel."""
+        if binding.id in instances:
+            return instances[binding.id]  # type: ignore
+
+        task = building.get(binding.id)
+        if task is None:
+            async def build() -> T:
+                try:
+                    res = instances[binding.id] = await binding.build_async(*args, **kwargs)
+                    if instances is self.singletons:
+                        self.revision += 1
+                    return res
+                finally:
+                    del building[binding.id]
+
+            task = building[binding.id] = asyncio.ensure_future(build())
+        return await asyncio.shield(task)
+
+    def is_async(self, binding: Binding[Any]) -> bool:
+        """Whether building the binding, or one of its dependencies, has to be awaited."""
+        return binding.builder.plan(0, ()).asynchronous
+
+    def is_built(self, binding: Binding[Any]) -> bool:
+        """Whether the binding is a singleton already built: plans of the current revision may hold its instance."""
+        return binding.singleton and binding.id in self.singletons
+
+    def fetcher(self, binding: Binding[T]) -> Callable[[], T]:
+        if self.frozen:
+            return self.factory(binding)
+        if self.is_built(binding):
+            return repeat(self.singletons[binding.id]).__next__
+        return partial(self.resolve, binding)
+
+    def async_fetcher(self, binding: Binding[T]) -> Callable[[], Awaitable[T]]:
+        return partial(self.resolve_async, binding)
 
     def instance(self, contract: BindingIdentifier[T] | type[T] | str, value: T) -> None:
         binding = self.get_binding(contract)
+        if binding.scoped:
+            self.scoped_instances(binding)[binding.id] = value
+            return
         if not binding.singleton:
-            raise ValueError("You can only set a instance for singletons.")
+            raise ValueError("You can only set a instance for singletons or scoped bindings.")
+        if self.frozen:
+            raise RuntimeError(f"Can't set the instance of {binding.id.name}, the container is frozen")
 
         self.singletons[binding.id] = value
+        self.revision += 1
+
+    def graph(self) -> DependencyGraph:
+        return DependencyGraph(self)
+
+    def validate(self) -> None:
+        """Raise a ValueError on unresolved annotations and a RuntimeError on circular dependencies."""
+        self.graph().validate()
+
+    def warm_up(self, executor: Optional[Executor] = None) -> None:
+        """Build every synchronous singleton, dependencies first, each layer concurrently with an executor."""
+        for layer in self.graph().layers():
+            bindings = [self.bindings[bind_id] for bind_id in layer]
+            bindings = [b for b in bindings if b.singleton and b.id not in self.singletons and not self.is_async(b)]
+            if executor is None or len(bindings) < 2:
+                for binding in bindings:
+                    self.resolve(binding)
+            else:
+                for _ in executor.map(self.resolve, bindings):
+                    pass
+
+    def freeze(self) -> None:
+        """Validate the dependency graph and compile the lookup table; binding afterward raises a RuntimeError."""
+        graph = self.graph()
+        graph.validate()
+
+        self.frozen = True
+        self.revision += 1
+        try:
+            for bind_id in graph.order():
+                self.factory(self.bindings[bind_id])
+            for alias, bind_id in self.aliases.items():
+                self.table[alias] = self.table[bind_id]
+        except BaseException:
+            self.frozen = False
+            self.revision += 1
+            self.table.clear()
+            raise
+
+    def factory(self, binding: Binding[T]) -> Callable[[], T]:
+        factory = self.table.get(binding.id)
+        if factory is None:
+            factory = self.table[binding.id] = self.table[binding.contract] = self.compile_factory(binding)
+        return factory
+
+    def compile_factory(self, binding: Binding[T]) -> Callable[[], T]:
+        injector = binding.builder
+        plan = injector.plan(0, ())
+        if plan.missing and binding.id not in self.singletons:
+            raise ValueError(f"Missing parameters of {binding.id.name}: {', '.join(plan.missing)}")
+
+        if binding.scoped or plan.asynchronous and binding.id not in self.singletons:
+            return partial(self.resolve, binding)
+        if binding.singleton:
+            # A C-level callable returning the instance: the cheapest possible factory.
+            return repeat(self.resolve(binding)).__next__
+
+        build = injector.callable
+        positional = plan.positional
+        keywords = plan.keywords
+        if keywords:
+            return lambda: build(*[fetch() for fetch in positional], **{name: fetch() for name, fetch in keywords})
+        if positional:
+            return lambda: build(*[fetch() for fetch in positional])
+        return build
 
     def inject(self, cl: Callable[..., T]) -> Injector[T]:
         return Injector(self, cl)
@@ -0,0 +1,102 @@
+from typing import Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .container import Container, Binding, BindingIdentifier
+
+
+class DependencyGraph:
+    """Dependencies of each binding of a container, from the parameter annotations of its builder."""
+
+    def __init__(self, container: "Container") -> None:
+        self.container: "Container" = container
+        self.dependencies: dict["BindingIdentifier[Any]", set["BindingIdentifier[Any]"]] = {}
+        self.missing: dict["BindingIdentifier[Any]", list[str]] = {}
+
+        for bind_id, binding in container.bindings.items():
+            dependencies: set["BindingIdentifier[Any]"] = set()
+            self.dependencies[bind_id] = dependencies
+            if bind_id in container.singletons:
+                continue
+
+            # Required parameters the injector can't fill, annotated or not.
+            missing = []
+            for name, param in binding.builder.param.items():
+                dependency = self.lookup(param.annotation) if param.annotation else None
+                if dependency is not None:
+                    dependencies.add(dependency.id)
+                elif not param.has_default and not (param.annotation and container.can_bind_missing(param.annotation)):
+                    missing.append(name)
+            if missing:
+                self.missing[bind_id] = missing
+
+    def lookup(self, annotation: Any) -> Optional["Binding[Any]"]:
+        try:
+            if self.container.is_bound(annotation):
+                return self.container.get_binding(annotation)
+        except KeyError:
+            pass
+        return None
+
+    def cycles(self) -> list[list["BindingIdentifier[Any]"]]:
+        """Cycles closed by the back edges of a depth-first walk, as paths starting and ending on the same binding."""
+        res: list[list["BindingIdentifier[Any]"]] = []
+        visited: set["BindingIdentifier[Any]"] = set()
+
+        for root in self.dependencies:
+            if root in visited:
+                continue
+            path: list["BindingIdentifier[Any]"] = [root]
+            on_path: set["BindingIdentifier[Any]"] = {root}
+            stack = [iter(self.dependencies[root])]
+            visited.add(root)
+            while stack:
+                dependency = next(stack[-1], None)
+                if dependency is None:
+                    stack.pop()
+                    on_path.remove(path.pop())
+                elif dependency in on_path:
+                    res.append(path[path.index(dependency):] + [dependency])
+                elif dependency not in visited:
+                    visited.add(dependency)
+                    path.append(dependency)
+                    on_path.add(dependency)
+                    stack.append(iter(self.dependencies[dependency]))
+        return res
+
+    def layers(self) -> list[list["BindingIdentifier[Any]"]]:
+        """Bindings in construction order: those of a layer only depend on the previous layers."""
+        remaining = {bind_id: len(dependencies) for bind_id, dependencies in self.dependencies.items()}
+        dependents: dict["BindingIdentifier[Any]", list["BindingIdentifier[Any]"]] = {}
+        for bind_id, dependencies in self.dependencies.items():
+            for dependency in dependencies:
+                dependents.setdefault(dependency, []).append(bind_id)
+
+        res: list[list["BindingIdentifier[Any]"]] = []
+        layer = [bind_id for bind_id, count in remaining.items() if count == 0]
+        while layer:
+            res.append(layer)
+            following = []
+            for bind_id in layer:
+                for dependent in dependents.get(bind_id, ()):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        following.append(dependent)
+            layer = following
+
+        if sum(len(layer) for layer in res) != len(self.dependencies):
+            raise RuntimeError(f"Cycle in dependencies: {self.describe_cycles()}")
+        return res
+
+    def order(self) -> list["BindingIdentifier[Any]"]:
+        """Topological construction order, dependencies first."""
+        return [bind_id for layer in self.layers() for bind_id in layer]
+
+    def describe_cycles(self) -> str:
+        return "; ".join(" -> ".join(bind_id.name for bind_id in cycle) for cycle in self.cycles())
+
+    def validate(self) -> None:
+        if self.missing:
+            details = "; ".join(f"{bind_id.name} ({', '.join(names)})" for bind_id, names in self.missing.items())
+            raise ValueError(f"Unresolved dependencies: {details}")
+        if self.cycles():
+            raise RuntimeError(f"Cycle in dependencies: {self.describe_cycles()}")
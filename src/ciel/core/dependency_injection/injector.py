@@ -1,4 +1,6 @@
-from typing import Callable, Any, TypeVar, Generic, TYPE_CHECKING
+from functools import partial
+from typing import Awaitable, Callable, Any, Optional, TypeVar, Generic, Collection, TYPE_CHECKING
+import asyncio
 import inspect
 
 T = TypeVar("T")
@@ -20,6 +22,25 @@ class Parameter:
         self.has_default = True
 
 
+class ResolutionPlan:
+    """Fetch steps of an injector for one call shape, compiled against one revision of the container."""
+
+    def __init__(self, positional: list[Callable[[], Any]], keywords: list[tuple[str, Callable[[], Any]]],
+                 missing: list[str], pending: list[tuple[int | str, Callable[[], Awaitable[Any]]]],
+                 asynchronous: bool, constant: bool = False) -> None:
+        self.positional: list[Callable[[], Any]] = positional
+        self.keywords: list[tuple[str, Callable[[], Any]]] = keywords
+        self.missing: list[str] = missing
+        self.pending: list[tuple[int | str, Callable[[], Awaitable[Any]]]] = pending
+        self.asynchronous: bool = asynchronous
+        # Every dependency is a built singleton: the call passes their instances without fetching them.
+        self.bound: Optional[tuple[Any, ...]] = None
+        self.bound_keywords: dict[str, Any] = {}
+        if constant and not missing:
+            self.bound = tuple(fetch() for fetch in positional)
+            self.bound_keywords = {name: fetch() for name, fetch in keywords}
+
+
 class Injector(Generic[T]):
 
     def __init__(self, container: "Container", cl: Callable[..., T]) -> None:
@@ -29,9 +50,14 @@ class Injector(Generic[T]):
         if isinstance(cl, type):
             to_inspect = cl.__init__  # type: ignore
             skip = True
+            self.coroutine: bool = False
         else:
             to_inspect = cl
             skip = False
+            self.coroutine = inspect.iscoroutinefunction(cl) or inspect.iscoroutinefunction(getattr(cl, "__call__", None))
+
+        self.revision: int = -1
+        self.plans: dict[int | tuple[Any, ...], ResolutionPlan] = {}
 
         self.param: dict[str, Parameter] = {}
         self.positional: list[str] = list()
@@ -56,36 +82,104 @@ class Injector(Generic[T]):
             if param.kind not in [inspect.Parameter.VAR_KEYWORD, inspect.Parameter.VAR_POSITIONAL]:
                 self.param[name] = res
 
-    def __call__(self, *args: Any, **kwargs: Any) -> T:
-        res_args: list[Any] = list(args)
-        res_kwargs = dict(kwargs)
-        presence = set()
-
-        for i in range(len(res_args)):
-            presence.add(self.positional[i])
-        for k in res_kwargs.keys():
-            if k in self.keywords:
-                presence.add(k)
-
-        for i in range(len(res_args), len(self.positional)):
-            if self.positional[i] in presence:
+    def plan(self, nargs: int, keywords: Collection[str]) -> ResolutionPlan:
+        if self.revision != self.container.revision:
+            self.plans.clear()
+            self.revision = self.container.revision
+
+        key = (nargs, *keywords) if keywords else nargs
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = self.plans[key] = self.compile(nargs, keywords)
+        return plan
+
+    def compile(self, nargs: int, keywords: Collection[str]) -> ResolutionPlan:
+        presence = set(self.positional[:nargs])
+        presence.update(k for k in keywords if k in self.keywords)
+
+        pending: list[tuple[int | str, Callable[[], Awaitable[Any]]]] = []
+        constant = True
+
+        positional: list[Callable[[], Any]] = []
+        for name in self.positional[nargs:]:
+            if name in presence:
                 break
-            param = self.param[self.positional[i]]
-            if param.annotation and self.container.is_bound(param.annotation):
-                res_args.append(self.container[param.annotation])
-                presence.add(param.name)
-            else:
+            fetchers = self.fetchers(self.param[name].annotation)
+            if fetchers is None:
                 break
-
-        for k in self.keywords:
-            if k in presence:
+            fetch, fetch_async, built = fetchers
+            constant = constant and built
+            if fetch_async is not None:
+                pending.append((len(positional), fetch_async))
+            positional.append(fetch)
+            presence.add(name)
+
+        named: list[tuple[str, Callable[[], Any]]] = []
+        for name in self.keywords:
+            if name in presence:
                 continue
-            param = self.param[k]
-            if param.annotation and self.container.is_bound(param.annotation):
-                res_kwargs[k] = self.container[param.annotation]
-                presence.add(param.name)
-
-        missing = set(filter(lambda n: not self.param[n].has_default, set(self.param.keys()) - presence))
-        if len(missing) > 0:
-            raise ValueError(f"Missing parameters: {', '.join(missing)}")
-        return self.callable(*res_args, **res_kwargs)
+            fetchers = self.fetchers(self.param[name].annotation)
+            if fetchers is not None:
+                fetch, fetch_async, built = fetchers
+                constant = constant and built
+                if fetch_async is not None:
+                    pending.append((name, fetch_async))
+                named.append((name, fetch))
+                presence.add(name)
+
+        missing = [name for name, param in self.param.items() if name not in presence and not param.has_default]
+        return ResolutionPlan(positional, named, missing, pending, self.coroutine or len(pending) > 0, constant)
+
+    def fetchers(self, annotation: Any) -> Optional[
+            tuple[Callable[[], Any], Optional[Callable[[], Awaitable[Any]]], bool]]:
+        """Fetch callables of a dependency, awaitable one if it builds asynchronously, and whether it's built."""
+        container = self.container
+        if not annotation:
+            return None
+        if container.is_bound(annotation):
+            binding = container.get_binding(annotation)
+            if container.is_built(binding):
+                return container.fetcher(binding), None, True
+            fetch_async = container.async_fetcher(binding) if container.is_async(binding) else None
+            return container.fetcher(binding), fetch_async, False
+        if container.can_bind_missing(annotation):
+            # Bound on demand, such as by a lazy module: `call_async` binds it without blocking the loop.
+            return partial(container.make, annotation), partial(container.make_async, annotation), False
+        return None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T:
+        # Inlined `plan` lookup of positional-only calls, the hot path of endpoints and factories.
+        plan = self.plans.get(len(args)) if not kwargs and self.revision == self.container.revision else None
+        if plan is None:
+            plan = self.plan(len(args), kwargs)
+        bound = plan.bound
+        if bound is not None:
+            return self.callable(*args, *bound, **kwargs, **plan.bound_keywords)
+        if plan.missing:
+            raise ValueError(f"Missing parameters: {', '.join(plan.missing)}")
+        if plan.positional:
+            args = (*args, *[fetch() for fetch in plan.positional])
+        for name, fetch in plan.keywords:
+            kwargs[name] = fetch()
+        return self.callable(*args, **kwargs)
+
+    async def call_async(self, *args: Any, **kwargs: Any) -> T:
+        """Call with every dependency resolved, awaiting the asynchronous ones concurrently."""
+        plan = self.plan(len(args), kwargs)
+        if plan.missing:
+            raise ValueError(f"Missing parameters: {', '.join(plan.missing)}")
+
+        resolved: dict[int | str, Any] = {}
+        if plan.pending:
+            values = await asyncio.gather(*[fetch() for _, fetch in plan.pending])
+            resolved = {slot: value for (slot, _), value in zip(plan.pending, values)}
+
+        if plan.positional:
+            args = (*args, *[resolved[i] if i in resolved else fetch() for i, fetch in enumerate(plan.positional)])
+        for name, fetch in plan.keywords:
+            kwargs[name] = resolved[name] if name in resolved else fetch()
+
+        res = self.callable(*args, **kwargs)
+        if self.coroutine:
+            return await res  # type: ignore
+        return res
@@ -0,0 +1,34 @@
+from asyncio import Future
+from contextvars import ContextVar, Token
+from typing import Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .container import BindingIdentifier, Container
+
+
+class Scope:
+    """Instances of the scoped bindings of a container within one `with container.scope():` block."""
+
+    __slots__ = ("container", "parent", "token", "instances", "building")
+
+    def __init__(self, container: "Container") -> None:
+        self.container: Container = container
+        self.parent: Optional[Scope] = None
+        self.token: Optional[Token[Optional[Scope]]] = None
+        self.instances: dict["BindingIdentifier[Any]", Any] = {}
+        self.building: dict["BindingIdentifier[Any]", Future[Any]] = {}
+
+    def __enter__(self) -> "Scope":
+        self.parent = CURRENT_SCOPE.get()
+        self.token = CURRENT_SCOPE.set(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.token is not None:
+            CURRENT_SCOPE.reset(self.token)
+            self.token = None
+        self.parent = None
+        self.instances.clear()
+
+
+CURRENT_SCOPE: ContextVar[Optional[Scope]] = ContextVar("ciel_scope", default=None)
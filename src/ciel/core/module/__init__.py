@@ -1,8 +1,17 @@
+from .discovery import discover
+from .lazy import LazyModule
 from .module import Module, ModuleManifest
 from .register import ModuleRegister
+from .resolver import resolve
+from .version import Requirement, parse_version
 
 __all__ = [
+    "LazyModule",
     "Module",
     "ModuleManifest",
     "ModuleRegister",
+    "Requirement",
+    "discover",
+    "parse_version",
+    "resolve",
 ]
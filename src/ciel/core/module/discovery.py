@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from ..util.file_util import write_json
+from .lazy import LazyModule, load_module_file
+from .module import Module, ModuleManifest
+from .version import Requirement, format_version, parse_version
+
+INDEX_VERSION = 1
+
+
+def manifest_to_json(manifest: ModuleManifest) -> dict[str, Any]:
+    return {
+        "name": manifest.name,
+        "version": format_version(manifest.version),
+        "dependencies": sorted(
+            [dep.name, dep.spec if isinstance(dep, Requirement) else "==" + format_version(dep.version)]
+            for dep in manifest.dependencies
+        ),
+    }
+
+
+def manifest_from_json(data: dict[str, Any]) -> ModuleManifest:
+    return ModuleManifest(
+        data["name"],
+        parse_version(data["version"]),
+        {Requirement(name, spec) for name, spec in data["dependencies"]},
+    )
+
+
+def load_index(path: Path) -> dict[str, Any]:
+    try:
+        index = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    return index
+
+
+def discover(directory: Path, index: Optional[Path] = None, attribute: str = "module") -> list[Module]:
+    """Find the modules in `directory/*/module.py`, deferring the unchanged ones listed in `index`."""
+    previous = load_index(index) if index is not None else {}
+    entries: dict[str, Any] = previous.get("modules", {})
+
+    modules: list[Module] = []
+    updated: dict[str, Any] = {}
+    for path in sorted(directory.glob("*/module.py")):
+        name = path.parent.name
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+
+        entry = entries.get(name)
+        if entry is not None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size \
+                and (entry["provides"] or entry["routes"]):
+            modules.append(LazyModule(manifest_from_json(entry["manifest"]), path, attribute,
+                                      entry["provides"], entry["routes"], name))
+            updated[name] = entry
+            continue
+
+        module = load_module_file(name, path, attribute)
+        modules.append(module)
+        updated[name] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "manifest": manifest_to_json(module.manifest),
+            "provides": list(getattr(module, "provides", ())),
+            "routes": list(getattr(module, "routes", ())),
+        }
+
+    if index is not None and updated != entries:
+        write_json(index, {"version": INDEX_VERSION, "modules": updated})
+    return modules
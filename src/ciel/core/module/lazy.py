@@ -0,0 +1,71 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+from ..dependency_injection.container import BindingIdentifier
+from ..util.import_util import dyn_import
+from .module import Module, ModuleManifest
+
+if TYPE_CHECKING:
+    from ..application import Application
+
+
+def contract_name(contract: Any) -> Optional[str]:
+    """Name under which a lazy module declares a contract: an alias, or the qualified name of a type."""
+    if isinstance(contract, str):
+        return contract
+    if isinstance(contract, type):
+        return BindingIdentifier.gen_name(contract)
+    if isinstance(contract, BindingIdentifier):
+        return contract.name
+    return None
+
+
+def load_module_file(name: str, path: Path, attribute: str = "module") -> Module:
+    """Import a module file as `ciel_modules.<name>` and return the module it defines."""
+    imported = dyn_import(f"ciel_modules.{name}", path)
+    target = getattr(imported, attribute)
+    module = target if isinstance(target, Module) else target()
+    if not isinstance(module, Module):
+        raise TypeError(f"{path}:{attribute} is not a module")
+    return module
+
+
+class LazyModule(Module):
+    """Module imported when a contract it `provides`, or a path under its `routes`, is first needed."""
+
+    def __init__(self, manifest: ModuleManifest, path: Path, attribute: str = "module", provides: Iterable[str] = (),
+                 routes: Iterable[str] = (), import_name: Optional[str] = None) -> None:
+        super().__init__(manifest)
+        self.path: Path = path
+        self.import_name: str = import_name or manifest.name
+        self.attribute: str = attribute
+        self.provides: list[str] = list(provides)
+        self.routes: list[str] = [route.rstrip("/") for route in routes]
+        self.loaded: Optional[Module] = None
+        self.loading: Optional[asyncio.Future[None]] = None
+        self.boot_due: bool = False
+        self.booted: bool = False
+
+    def load(self) -> Module:
+        """Import the module file and return the module it defines."""
+        module = load_module_file(self.import_name, self.path, self.attribute)
+        if module.manifest.name != self.manifest.name:
+            raise ValueError(f"{self.path} defines module {module.manifest}, not {self.manifest}")
+        return module
+
+    def covers(self, path: str) -> bool:
+        return any(path == route or path.startswith(route + "/") for route in self.routes)
+
+    def register(self, app: "Application") -> None:
+        app.defer(self)
+
+    def boot(self, app: "Application") -> None:
+        # Loaded before boot: its boot hook runs now, otherwise right after it is loaded.
+        self.boot_due = True
+        if self.loaded is not None and not self.booted:
+            app.boot_loaded(self, self.loaded)
+
+    async def shutdown(self, app: "Application") -> None:
+        if self.loaded is not None and self.booted:
+            await (app ^ self.loaded.shutdown).call_async()
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Any, TYPE_CHECKING, Self
+from typing import Any, ClassVar, TYPE_CHECKING
+
+from .version import Requirement, Version
 
 if TYPE_CHECKING:
     from ..application import Application
@@ -7,9 +9,17 @@ if TYPE_CHECKING:
 
 @dataclass
 class ModuleManifest:
+    """Name, version and dependencies of a module: exact manifests or `Requirement` ranges."""
     name: str
-    version: tuple[int, int, int] = (0, 0, 0)
-    dependencies: set[Self] = field(default_factory=set)
+    version: Version = (0, 0, 0)
+    dependencies: set["ModuleManifest | Requirement"] = field(default_factory=set)
+
+    def satisfies(self, dependency: "ModuleManifest | Requirement") -> bool:
+        if self.name != dependency.name:
+            return False
+        if isinstance(dependency, Requirement):
+            return dependency.matches(self.version)
+        return self.version == dependency.version
 
     def __repr__(self) -> str:
         return f"{self.name} v{'.'.join([str(v) for v in self.version])}"
@@ -24,6 +34,9 @@ class ModuleManifest:
 
 
 class Module:
+    # Whether its blocking hooks may run in a worker thread, concurrently with others of the same layer: only if
+    # they don't register bindings or routes, which aren't thread-safe.
+    threaded: ClassVar[bool] = False
 
     def __init__(self, manifest: ModuleManifest) -> None:
         self.manifest = manifest
@@ -34,5 +47,10 @@ class Module:
     def register(self, app: "Application") -> None:
         pass
 
-    def boot(self, *args: Any, **kwargs: Any) -> None:
+    def boot(self, *args: Any, **kwargs: Any) -> Any:
+        """Called once every module is registered, with its parameters injected. May be a coroutine function."""
+        pass
+
+    def shutdown(self, *args: Any, **kwargs: Any) -> Any:
+        """Called when the server shuts down, with its parameters injected. May be a coroutine function."""
         pass
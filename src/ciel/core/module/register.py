@@ -1,36 +1,155 @@
-from collections import defaultdict
-from .module import Module, ModuleManifest
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+from .module import Module
+from .resolver import load_resolution, manifests_key, resolve, save_resolution
 
 
 class ModuleRegister:
+    """Orders modules by their dependencies, in `modules` and in `layers` of independent modules."""
 
-    def __init__(self, modules: list[Module]) -> None:
-        indexed = {m.manifest: m for m in modules}
+    def __init__(self, modules: list[Module], cache: Optional[Path] = None) -> None:
+        self.indexed: dict[str, Module] = {}
+        # Keyed by module rather than manifest: modules hash by identity, without a Python call.
+        self.requires: dict[Module, list[Module]] = {}
+        self.dependents: dict[Module, set[Module]] = {}
+        self.depth: dict[Module, int] = {}
+        self.layers: list[list[Module]] = []
+        self.modules: list[Module] = []
 
-        in_edges = defaultdict(set)
-        out_edges = defaultdict(set)
+        if cache is None:
+            self.add(*resolve(modules))
+            return
+        key = manifests_key(modules)
+        resolved = load_resolution(cache, key, modules)
+        if resolved is not None:
+            self.add_sorted(resolved)
+        else:
+            self.add(*resolve(modules))
+            save_resolution(cache, key, self.modules)
 
-        roots: list[ModuleManifest] = []
+    def add(self, *modules: Module) -> None:
+        """Add modules, which may depend on each other and on the modules already registered."""
+        added: dict[str, Module] = {}
+        for m in modules:
+            other = added.setdefault(m.manifest.name, m)
+            if other is not m and other.manifest != m.manifest:
+                raise ValueError(f"Several versions of module {m.manifest.name}: {other} and {m}")
 
-        for m in indexed.keys():
-            if len(m.dependencies):
-                for dep in m.dependencies:
-                    if dep not in indexed:
+        # Kahn's algorithm, restricted to the added modules: the others are already sorted.
+        requires: dict[Module, list[Module]] = {}
+        pending: dict[Module, int] = {}
+        dependents: dict[Module, list[Module]] = {}
+        for name, module in added.items():
+            if name in self.indexed:
+                raise ValueError(f"Module already registered {self.indexed[name]}")
+            deps: list[Module] = []
+            count = 0
+            for dep in module.manifest.dependencies:
+                new = added.get(dep.name)
+                if new is not None and new.manifest.satisfies(dep):
+                    count += 1
+                    if new in dependents:
+                        dependents[new].append(module)
+                    else:
+                        dependents[new] = [module]
+                    deps.append(new)
+                else:
+                    existing = self.indexed.get(dep.name)
+                    if existing is None or not existing.manifest.satisfies(dep):
                         raise ValueError(f"Missing dependency {dep}")
-                    in_edges[m].add(dep)
-                    out_edges[dep].add(m)
-            else:
-                roots.append(m)
+                    deps.append(existing)
+            requires[module] = deps
+            pending[module] = count
 
-        self.modules: list[Module] = []
-        while len(roots) > 0:
-            n = roots.pop(0)
-            self.modules.append(indexed[n])
-            for m in list(out_edges[n]):
-                out_edges[n].remove(m)
-                in_edges[m].remove(n)
-                if len(in_edges[m]) == 0:
+        roots = deque(m for m, count in pending.items() if count == 0)
+        order: list[Module] = []
+        depth = self.depth
+        while roots:
+            n = roots.popleft()
+            order.append(n)
+            depth[n] = max([depth[dep] for dep in requires[n]], default=-1) + 1
+            for m in dependents.get(n, ()):
+                pending[m] -= 1
+                if pending[m] == 0:
                     roots.append(m)
 
-        if any((len(in_edges[m]) > 0 or len(out_edges[m]) > 0) for m in indexed.keys()):
-            raise RuntimeError("Cycle in module dependencies")
+        if len(order) < len(added):
+            remaining = {m for m, count in pending.items() if count > 0}
+            for n in order:
+                del depth[n]
+            raise RuntimeError(f"Cycle in module dependencies: {self.find_cycle(remaining, requires)}")
+
+        self._insert(order, requires)
+
+    def add_sorted(self, modules: list[Module]) -> None:
+        """Add modules already listed after their dependencies, such as a saved order: they aren't sorted again."""
+        requires: dict[Module, list[Module]] = {}
+        indexed: dict[str, Module] = {}
+        depth = self.depth
+        try:
+            for module in modules:
+                name = module.manifest.name
+                if name in self.indexed or name in indexed:
+                    raise ValueError(f"Module already registered {module}")
+                deps: list[Module] = []
+                for dep in module.manifest.dependencies:
+                    existing = indexed.get(dep.name) or self.indexed.get(dep.name)
+                    if existing is None or not existing.manifest.satisfies(dep):
+                        raise ValueError(f"Missing dependency {dep} of {module}, or listed after it")
+                    deps.append(existing)
+                depth[module] = max([depth[dep] for dep in deps], default=-1) + 1
+                requires[module] = deps
+                indexed[name] = module
+        except ValueError:
+            for module in requires:
+                del depth[module]
+            raise
+        self._insert(modules, requires)
+
+    def _insert(self, order: list[Module], requires: dict[Module, list[Module]]) -> None:
+        depth = self.depth
+        for n in order:
+            self.indexed[n.manifest.name] = n
+            self.requires[n] = requires[n]
+            self.dependents[n] = set()
+            for dep in requires[n]:
+                self.dependents[dep].add(n)
+            while len(self.layers) <= depth[n]:
+                self.layers.append([])
+            self.layers[depth[n]].append(n)
+        self.modules.extend(order)
+
+    def remove(self, *modules: Module) -> None:
+        """Remove modules, as long as no remaining module depends on them."""
+        removed = set(modules)
+        for m in removed:
+            if self.indexed.get(m.manifest.name) is not m:
+                raise ValueError(f"Module not registered {m}")
+            blocking = self.dependents[m] - removed
+            if blocking:
+                raise ValueError(f"Module {m} is required by {', '.join(map(repr, blocking))}")
+
+        for m in removed:
+            del self.indexed[m.manifest.name]
+            del self.dependents[m]
+            self.layers[self.depth.pop(m)].remove(m)
+            for dep in self.requires.pop(m):
+                if dep not in removed:
+                    self.dependents[dep].discard(m)
+        while self.layers and not self.layers[-1]:
+            self.layers.pop()
+        self.modules = [m for m in self.modules if m not in removed]
+
+    @staticmethod
+    def find_cycle(remaining: set[Module], requires: dict[Module, list[Module]]) -> str:
+        """Path of a cycle among modules left unsorted, each of which depends on another one of them."""
+        path: list[Module] = []
+        position: dict[Module, int] = {}
+        n = next(iter(remaining))
+        while n not in position:
+            position[n] = len(path)
+            path.append(n)
+            n = next(dep for dep in requires[n] if dep in remaining)
+        return " -> ".join(m.manifest.name for m in path[position[n]:] + [n])
@@ -0,0 +1,104 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..util.file_util import write_json
+from .module import Module, ModuleManifest
+from .version import Requirement, format_version
+
+
+def resolve(modules: Iterable[Module]) -> list[Module]:
+    """Pick the highest versions of the modules that satisfy every dependency, or raise a ValueError."""
+    candidates: dict[str, list[Module]] = {}
+    single = True
+    for module in modules:
+        versions = candidates.get(module.manifest.name)
+        if versions is None:
+            candidates[module.manifest.name] = [module]
+        elif all(module.manifest != other.manifest for other in versions):
+            versions.append(module)
+            single = False
+
+    if single:
+        # Nothing to choose: the register checks the versions.
+        for versions in candidates.values():
+            for dep in versions[0].manifest.dependencies:
+                if dep.name not in candidates:
+                    raise ValueError(f"Missing dependency {dep}")
+        return [versions[0] for versions in candidates.values()]
+
+    # Constraints of every candidate on each module name, checked when a version of that module is picked.
+    constraints: dict[str, list[tuple[Module, ModuleManifest | Requirement]]] = {}
+    for versions in candidates.values():
+        for module in versions:
+            for dep in module.manifest.dependencies:
+                if dep.name not in candidates:
+                    raise ValueError(f"Missing dependency {dep}")
+                constraints.setdefault(dep.name, []).append((module, dep))
+
+    for versions in candidates.values():
+        versions.sort(key=lambda m: m.manifest.version, reverse=True)
+    # Modules with a single version first: they constrain the choice of the others.
+    names = sorted(candidates, key=lambda n: len(candidates[n]))
+    chosen: dict[str, Module] = {}
+
+    def consistent(module: Module) -> bool:
+        for dep in module.manifest.dependencies:
+            other = chosen.get(dep.name)
+            if other is not None and not other.manifest.satisfies(dep):
+                return False
+        for owner, dep in constraints.get(module.manifest.name, ()):
+            if chosen.get(owner.manifest.name) is owner and not module.manifest.satisfies(dep):
+                return False
+        return True
+
+    def search(index: int) -> bool:
+        if index == len(names):
+            return True
+        name = names[index]
+        for candidate in candidates[name]:
+            if consistent(candidate):
+                chosen[name] = candidate
+                if search(index + 1):
+                    return True
+                del chosen[name]
+        return False
+
+    if not search(0):
+        conflicting = ", ".join(name for name, versions in candidates.items() if len(versions) > 1)
+        raise ValueError(f"No compatible versions of modules {conflicting}")
+    return [chosen[name] for name in candidates]
+
+
+def manifests_key(modules: Iterable[Module]) -> str:
+    """Hash of the names, versions and dependencies of every module."""
+    manifests = sorted(
+        [m.manifest.name, format_version(m.manifest.version), sorted(repr(dep) for dep in m.manifest.dependencies)]
+        for m in modules
+    )
+    return hashlib.sha256(json.dumps(manifests).encode()).hexdigest()
+
+
+def load_resolution(path: Path, key: str, modules: Iterable[Module]) -> Optional[list[Module]]:
+    """Modules resolved and ordered by a previous run, if the cache at `path` was saved for the same manifests."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+
+    index = {(m.manifest.name, format_version(m.manifest.version)): m for m in modules}
+    try:
+        return [index[(name, version)] for name, version in data["modules"]]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def save_resolution(path: Path, key: str, modules: Iterable[Module]) -> None:
+    """Save resolved and ordered modules."""
+    write_json(path, {
+        "key": key,
+        "modules": [[m.manifest.name, format_version(m.manifest.version)] for m in modules],
+    })
@@ -0,0 +1,84 @@
+import re
+
+Version = tuple[int, int, int]
+
+COMPARATOR = re.compile(r"(\^|~|==|!=|>=|<=|>|<|=)?\s*v?(\d+(?:\.\d+){0,2}|\*)")
+
+
+def parse_version(text: str) -> Version:
+    """Parse `major[.minor[.patch]]`, missing parts being 0."""
+    parts = text.strip().lstrip("v").split(".")
+    if not 1 <= len(parts) <= 3 or not all(part.isdigit() for part in parts):
+        raise ValueError(f"Invalid version: {text}")
+    major, minor, patch = (int(part) for part in parts + ["0"] * (3 - len(parts)))
+    return major, minor, patch
+
+
+def format_version(version: Version) -> str:
+    return ".".join(str(v) for v in version)
+
+
+def bump(version: Version, index: int) -> Version:
+    """Smallest version above every version sharing the first `index + 1` parts of `version`."""
+    parts = [*version[:index], version[index] + 1, 0, 0]
+    return parts[0], parts[1], parts[2]
+
+
+class Requirement:
+    """Constraint on a module version: semver ranges (`^`, `~`, `1.2`, comparisons, `*`) joined by commas."""
+
+    __slots__ = ("name", "spec", "comparators")
+
+    def __init__(self, name: str, spec: str = "*") -> None:
+        self.name: str = name
+        self.spec: str = spec
+        self.comparators: list[tuple[str, Version]] = []
+        for part in spec.split(","):
+            self.comparators.extend(self.parse(part.strip()))
+
+    def parse(self, text: str) -> list[tuple[str, Version]]:
+        match = COMPARATOR.fullmatch(text)
+        if match is None:
+            raise ValueError(f"Invalid version constraint for {self.name}: {text}")
+        op, number = match.group(1) or "", match.group(2)
+        if number == "*":
+            if op:
+                raise ValueError(f"Invalid version constraint for {self.name}: {text}")
+            return []
+
+        version = parse_version(number)
+        given = number.count(".") + 1
+        if op == "^":
+            # The first non-zero part given is the one that must not change.
+            index = next((i for i, v in enumerate(version[:given]) if v), given - 1)
+            return [(">=", version), ("<", bump(version, index))]
+        if op == "~":
+            return [(">=", version), ("<", bump(version, min(given - 1, 1)))]
+        if op in ("", "=", "=="):
+            if given == 3:
+                return [("==", version)]
+            return [(">=", version), ("<", bump(version, given - 1))]
+        return [(op, version)]
+
+    def matches(self, version: Version) -> bool:
+        for op, bound in self.comparators:
+            if op == "==" and version != bound \
+                    or op == "!=" and version == bound \
+                    or op == ">=" and version < bound \
+                    or op == ">" and version <= bound \
+                    or op == "<=" and version > bound \
+                    or op == "<" and version >= bound:
+                return False
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Requirement):
+            return False
+        return self.name == other.name and self.comparators == other.comparators
+
+    def __hash__(self) -> int:
+        return hash((self.name, tuple(self.comparators)))
+
+    def __repr__(self) -> str:
+        return f"{self.name} {self.spec}"
+
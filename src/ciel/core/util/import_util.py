@@ -2,6 +2,7 @@ import sys
 from pathlib import Path
 from typing import Any
 import importlib.util
+from . import tracing
 
 
 def dyn_import(name: str, path: Path, remember: bool = True) -> Any:
@@ -14,5 +15,6 @@ def dyn_import(name: str, path: Path, remember: bool = True) -> Any:
     loader = spec.loader
     if not loader:
         raise ImportError(f"Can't find module {name}")
-    loader.exec_module(module)
+    with tracing.span(name, "import"):
+        loader.exec_module(module)
     return module
@@ -0,0 +1,116 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+ENV_VAR = "CIEL_STARTUP_TRACE"
+
+NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class Span:
+    __slots__ = ("name", "category", "start", "duration", "memory", "thread")
+
+    def __init__(self, name: str, category: str, start: int, duration: int, memory: int, thread: int) -> None:
+        self.name: str = name
+        self.category: str = category
+        self.start: int = start
+        self.duration: int = duration
+        self.memory: int = memory
+        self.thread: int = thread
+
+
+class Tracer:
+    """Wall time and memory allocated by the spans of the startup."""
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self.spans: list[Span] = []
+        self.origin: int = time.perf_counter_ns()
+        self.owns_tracemalloc: bool = not tracemalloc.is_tracing()
+        if self.owns_tracemalloc:
+            tracemalloc.start()
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.spans.append(Span(
+                name, category, start - self.origin, time.perf_counter_ns() - start,
+                tracemalloc.get_traced_memory()[0] - memory, threading.get_ident(),
+            ))
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Trace in the Chrome trace event format, which Perfetto and chrome://tracing open."""
+        pid = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start / 1000,
+                    "dur": span.duration / 1000,
+                    "pid": pid,
+                    "tid": span.thread,
+                    "args": {"memory": span.memory},
+                }
+                for span in self.spans
+            ],
+        }
+
+    def summary(self, limit: int = 20) -> str:
+        """Total time of each category, then the longest spans of each one."""
+        lines = ["Startup trace"]
+        for category in dict.fromkeys(span.category for span in self.spans):
+            spans = sorted((s for s in self.spans if s.category == category), key=lambda s: s.duration, reverse=True)
+            total = sum(s.duration for s in spans)
+            lines.append(f"\n{category}: {len(spans)} spans, {total / 1e6:.2f} ms")
+            for span in spans[:limit]:
+                lines.append(f"  {span.name:<60} {span.duration / 1e6:>10.2f} ms {span.memory / 1024:>10.1f} KiB")
+        return "\n".join(lines) + "\n"
+
+    def finish(self) -> None:
+        """Stop tracing memory, and write the Chrome trace to `path` and the summary next to it, as `.txt`."""
+        if self.owns_tracemalloc:
+            tracemalloc.stop()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.chrome_trace()))
+        self.path.with_suffix(".txt").write_text(self.summary())
+
+
+current: Optional[Tracer] = None
+
+
+def span(name: str, category: str) -> AbstractContextManager[None]:
+    """Span of the current tracer, or a shared no-op context manager when tracing is disabled."""
+    if current is None:
+        return NULL_SPAN
+    return current.span(name, category)
+
+
+def start(base_path: Path) -> Optional[Tracer]:
+    """Start tracing if `CIEL_STARTUP_TRACE` is set, to the trace path or to 1 for the default one."""
+    global current
+    value = os.environ.get(ENV_VAR)
+    if not value or value == "0":
+        return None
+    if current is None:
+        path = base_path / ".ciel" / "startup-trace.json" if value == "1" else Path(value)
+        current = Tracer(path)
+    return current
+
+
+def stop(tracer: Tracer) -> None:
+    global current
+    if current is tracer:
+        current = None
+        tracer.finish()
@@ -1,8 +1,29 @@
 from .module import HttpModule
 from .http_objects import Request, Response
+from .kernel import HttpKernel
+from .errors import ClientDisconnect, HttpError, PayloadTooLarge
+from .headers import Headers, HeaderTemplate
+from .forms import FormData, FormLimits, UploadFile
+from .json import JsonBackend
+from .responses import JSONResponse, StreamingResponse, FileResponse
+from .routing import Router
 
 __all__ = [
+    "ClientDisconnect",
+    "FileResponse",
+    "FormData",
+    "FormLimits",
+    "HeaderTemplate",
+    "Headers",
+    "HttpError",
+    "HttpKernel",
     "HttpModule",
+    "JSONResponse",
+    "JsonBackend",
+    "PayloadTooLarge",
     "Request",
     "Response",
-]
\ No newline at end of file
+    "Router",
+    "StreamingResponse",
+    "UploadFile",
+]
@@ -0,0 +1,21 @@
+from http import HTTPStatus
+
+
+class HttpError(Exception):
+    """Error that the kernel turns into a response with the given status, instead of letting it reach the server."""
+
+    def __init__(self, status: int, detail: str = "") -> None:
+        super().__init__(detail or HTTPStatus(status).phrase)
+        self.status: int = status
+        self.detail: str = detail or HTTPStatus(status).phrase
+
+
+class ClientDisconnect(Exception):
+    """The client disconnected before the whole request body was received."""
+
+
+class PayloadTooLarge(HttpError):
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(413, f"Request body larger than {limit} bytes")
+        self.limit: int = limit
@@ -0,0 +1,306 @@
+import asyncio
+import codecs
+import re
+from dataclasses import dataclass
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterable, Iterator, Optional, Tuple
+from urllib.parse import unquote_plus
+
+from .errors import HttpError
+from .headers import Headers
+
+OPTION = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:\\.|[^"\\])*"|[^;]*)')
+
+
+def parse_options(value: str) -> Tuple[str, dict[str, str]]:
+    """Split a header value such as `form-data; name="file"; filename="a.txt"` into its value and options."""
+    main, _, rest = value.partition(";")
+    options: dict[str, str] = {}
+    for match in OPTION.finditer(";" + rest):
+        option = match.group(2).strip()
+        if option.startswith('"'):
+            option = re.sub(r"\\(.)", r"\1", option[1:-1])
+        options[match.group(1).lower()] = option
+    return main.strip().lower(), options
+
+
+@dataclass
+class FormLimits:
+    """Limits enforced while a form is parsed; files larger than `spool_size` are moved to disk."""
+    max_fields: int = 1000
+    max_files: int = 100
+    max_field_size: int = 1024 * 1024
+    max_file_size: Optional[int] = None
+    max_part_header_size: int = 16 * 1024
+    spool_size: int = 1024 * 1024
+
+
+class UploadFile:
+    """File part of a multipart form, kept in memory up to `spool_size` bytes and on disk beyond."""
+
+    def __init__(self, filename: str, content_type: str, headers: Headers, spool_size: int) -> None:
+        self.filename: str = filename
+        self.content_type: str = content_type
+        self.headers: Headers = headers
+        self.size: int = 0
+        self.spool_size: int = spool_size
+        self.file: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(max_size=spool_size)
+
+    @property
+    def in_memory(self) -> bool:
+        return self.size <= self.spool_size
+
+    async def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.in_memory:
+            self.file.write(data)
+        else:
+            await asyncio.to_thread(self.file.write, data)
+
+    async def read(self, size: int = -1) -> bytes:
+        if self.in_memory:
+            return self.file.read(size)
+        return await asyncio.to_thread(self.file.read, size)
+
+    async def seek(self, offset: int) -> None:
+        if self.in_memory:
+            self.file.seek(offset)
+        else:
+            await asyncio.to_thread(self.file.seek, offset)
+
+    async def close(self) -> None:
+        if self.in_memory:
+            self.file.close()
+        else:
+            await asyncio.to_thread(self.file.close)
+
+    def __repr__(self) -> str:
+        return f"UploadFile({self.filename!r}, {self.content_type!r}, size={self.size})"
+
+
+class FormData:
+    """Fields of a form, in order; a name may appear several times. Values are `str`, or `UploadFile` for files."""
+
+    def __init__(self, items: Optional[list[Tuple[str, str | UploadFile]]] = None) -> None:
+        self.items: list[Tuple[str, str | UploadFile]] = items if items is not None else []
+
+    def __getitem__(self, key: str) -> str | UploadFile:
+        for name, value in self.items:
+            if name == key:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Optional[str | UploadFile] = None) -> Optional[str | UploadFile]:
+        for name, value in self.items:
+            if name == key:
+                return value
+        return default
+
+    def get_all(self, key: str) -> list[str | UploadFile]:
+        return [value for name, value in self.items if name == key]
+
+    def __contains__(self, key: str) -> bool:
+        return any(name == key for name, _ in self.items)
+
+    def __iter__(self) -> Iterator[Tuple[str, str | UploadFile]]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def files(self) -> list[UploadFile]:
+        return [value for _, value in self.items if isinstance(value, UploadFile)]
+
+    async def close(self) -> None:
+        for file in self.files():
+            await file.close()
+
+
+class UrlencodedParser:
+    """Parses an `application/x-www-form-urlencoded` body chunk by chunk, one `name=value` pair at a time."""
+
+    def __init__(self, limits: FormLimits, charset: str = "utf-8") -> None:
+        self.limits: FormLimits = limits
+        self.charset: str = charset
+        self.buffer: bytearray = bytearray()
+        self.form: FormData = FormData()
+
+    def add(self, pair: bytes) -> None:
+        if not pair:
+            return
+        if len(self.form) >= self.limits.max_fields:
+            raise HttpError(413, f"More than {self.limits.max_fields} form fields")
+        name, _, value = pair.decode(self.charset, "replace").partition("=")
+        self.form.items.append((unquote_plus(name), unquote_plus(value)))
+
+    async def feed(self, chunk: bytes) -> None:
+        self.buffer += chunk
+        *pairs, rest = self.buffer.split(b"&")
+        if len(rest) > self.limits.max_field_size:
+            raise HttpError(413, f"Form field larger than {self.limits.max_field_size} bytes")
+        for pair in pairs:
+            if len(pair) > self.limits.max_field_size:
+                raise HttpError(413, f"Form field larger than {self.limits.max_field_size} bytes")
+            self.add(bytes(pair))
+        self.buffer = rest
+
+    async def finish(self) -> FormData:
+        self.add(bytes(self.buffer))
+        self.buffer.clear()
+        return self.form
+
+
+PREAMBLE, BOUNDARY, HEADERS, BODY, END = range(5)
+
+
+class MultipartParser:
+    """Parses a `multipart/form-data` body chunk by chunk."""
+
+    def __init__(self, boundary: bytes, limits: FormLimits, charset: str = "utf-8") -> None:
+        if not boundary or len(boundary) > 200:
+            raise HttpError(400, "Invalid multipart boundary")
+        self.delimiter: bytes = b"\r\n--" + boundary
+        self.limits: FormLimits = limits
+        self.charset: str = charset
+        # The first boundary is not preceded by a line break.
+        self.buffer: bytearray = bytearray(b"\r\n")
+        self.state: int = PREAMBLE
+        self.form: FormData = FormData()
+        self.fields: int = 0
+        self.name: str = ""
+        self.value: bytearray = bytearray()
+        self.file: Optional[UploadFile] = None
+
+    async def feed(self, chunk: bytes) -> None:
+        buffer = self.buffer
+        buffer += chunk
+        keep = len(self.delimiter) - 1
+
+        while True:
+            if self.state == PREAMBLE:
+                index = buffer.find(self.delimiter)
+                if index < 0:
+                    del buffer[:-keep]
+                    return
+                del buffer[:index + len(self.delimiter)]
+                self.state = BOUNDARY
+
+            elif self.state == BOUNDARY:
+                if len(buffer) < 2:
+                    return
+                if buffer[:2] == b"--":
+                    self.state = END
+                    buffer.clear()
+                    return
+                if buffer[:2] != b"\r\n":
+                    raise HttpError(400, "Invalid multipart boundary")
+                del buffer[:2]
+                self.state = HEADERS
+
+            elif self.state == HEADERS:
+                index = buffer.find(b"\r\n\r\n")
+                if index < 0:
+                    if len(buffer) > self.limits.max_part_header_size:
+                        raise HttpError(413, "Multipart part headers too large")
+                    return
+                self.start_part(bytes(buffer[:index]))
+                del buffer[:index + 4]
+                self.state = BODY
+
+            elif self.state == BODY:
+                index = buffer.find(self.delimiter)
+                if index < 0:
+                    if len(buffer) > keep:
+                        await self.write(bytes(buffer[:-keep]))
+                        del buffer[:-keep]
+                    return
+                await self.write(bytes(buffer[:index]))
+                await self.end_part()
+                del buffer[:index + len(self.delimiter)]
+                self.state = BOUNDARY
+
+            else:
+                buffer.clear()
+                return
+
+    def start_part(self, raw: bytes) -> None:
+        headers = Headers()
+        for line in raw.split(b"\r\n"):
+            name, colon, value = line.partition(b":")
+            if not colon:
+                raise HttpError(400, "Invalid multipart part header")
+            headers[name.strip()] = value.strip()
+
+        # Browsers send non-ASCII names and filenames as raw UTF-8.
+        disposition, options = parse_options((headers.get_raw("content-disposition") or b"").decode(self.charset, "replace"))
+        if disposition != "form-data" or "name" not in options:
+            raise HttpError(400, "Multipart part without a form-data name")
+        self.name = options["name"]
+
+        if "filename" in options:
+            if len(self.form.files()) >= self.limits.max_files:
+                raise HttpError(413, f"More than {self.limits.max_files} uploaded files")
+            self.file = UploadFile(options["filename"], headers.get("content-type", "application/octet-stream"),
+                                   headers, self.limits.spool_size)
+            self.form.items.append((self.name, self.file))
+        else:
+            if self.fields >= self.limits.max_fields:
+                raise HttpError(413, f"More than {self.limits.max_fields} form fields")
+            self.fields += 1
+            self.file = None
+
+    async def write(self, data: bytes) -> None:
+        if not data:
+            return
+        if self.file is None:
+            if len(self.value) + len(data) > self.limits.max_field_size:
+                raise HttpError(413, f"Form field larger than {self.limits.max_field_size} bytes")
+            self.value += data
+            return
+        limit = self.limits.max_file_size
+        if limit is not None and self.file.size + len(data) > limit:
+            raise HttpError(413, f"Uploaded file larger than {limit} bytes")
+        await self.file.write(data)
+
+    async def end_part(self) -> None:
+        if self.file is None:
+            self.form.items.append((self.name, self.value.decode(self.charset, "replace")))
+            self.value = bytearray()
+        else:
+            await self.file.seek(0)
+            self.file = None
+
+    async def finish(self) -> FormData:
+        if self.state != END:
+            raise HttpError(400, "Truncated multipart body")
+        return self.form
+
+
+async def parse_form(content_type: str, stream: AsyncIterable[bytes], limits: Optional[FormLimits] = None) -> FormData:
+    """Parse a form body according to its content type; uploaded files are closed only if it fails."""
+    limits = limits or FormLimits()
+    kind, options = parse_options(content_type)
+    charset = options.get("charset", "utf-8")
+    try:
+        codec = codecs.lookup(charset)
+    except LookupError:
+        codec = None
+    # Binary codecs such as base64 are found as well, but `bytes.decode` rejects them.
+    if codec is None or not getattr(codec, "_is_text_encoding", True):
+        raise HttpError(415, f"Unsupported form charset: {charset}")
+
+    parser: UrlencodedParser | MultipartParser
+    if kind == "application/x-www-form-urlencoded":
+        parser = UrlencodedParser(limits, charset)
+    elif kind == "multipart/form-data":
+        parser = MultipartParser(options.get("boundary", "").encode("latin-1"), limits, charset)
+    else:
+        raise HttpError(415, f"Unsupported form content type: {kind or 'none'}")
+
+    try:
+        async for chunk in stream:
+            await parser.feed(chunk)
+        return await parser.finish()
+    except BaseException:
+        await parser.form.close()
+        raise
@@ -0,0 +1,107 @@
+from typing import Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+
+
+def encode(value: str | bytes) -> bytes:
+    return value if isinstance(value, bytes) else value.encode("latin-1")
+
+
+class Headers:
+    """Header multimap over the ASGI list of lower-cased `(name, value)` byte pairs."""
+
+    __slots__ = ("raw", "readonly")
+
+    def __init__(self, raw: Optional[Iterable[Tuple[bytes, bytes]]] = None, readonly: bool = False) -> None:
+        if raw is None:
+            raw = []
+        elif not isinstance(raw, list):
+            raw = list(raw)
+        self.raw: list[Tuple[bytes, bytes]] = raw
+        self.readonly: bool = readonly
+
+    def get_raw(self, key: str | bytes) -> Optional[bytes]:
+        name = encode(key).lower()
+        for header, value in self.raw:
+            if header == name:
+                return value
+        return None
+
+    def get_all_raw(self, key: str | bytes) -> list[bytes]:
+        name = encode(key).lower()
+        return [value for header, value in self.raw if header == name]
+
+    def __getitem__(self, key: str | bytes) -> str:
+        value = self.get_raw(key)
+        if value is None:
+            raise KeyError(key)
+        return value.decode("latin-1")
+
+    def get(self, key: str | bytes, default: Optional[str] = None) -> Optional[str]:
+        value = self.get_raw(key)
+        return default if value is None else value.decode("latin-1")
+
+    def get_all(self, key: str | bytes) -> list[str]:
+        return [value.decode("latin-1") for value in self.get_all_raw(key)]
+
+    def __contains__(self, key: str | bytes) -> bool:
+        return self.get_raw(key) is not None
+
+    def __setitem__(self, key: str | bytes, value: list[str | bytes] | str | bytes) -> None:
+        """Same semantic as `HttpData`: a list replaces every value of the header, a single value is appended."""
+        if self.readonly:
+            raise ValueError("Headers are read-only")
+        name = encode(key).lower()
+        if isinstance(value, list):
+            self.raw[:] = [(header, v) for header, v in self.raw if header != name]
+            self.raw.extend((name, encode(v)) for v in value)
+        else:
+            self.raw.append((name, encode(value)))
+
+    def __delitem__(self, key: str | bytes) -> None:
+        if self.readonly:
+            raise ValueError("Headers are read-only")
+        name = encode(key).lower()
+        self.raw[:] = [(header, value) for header, value in self.raw if header != name]
+
+    def __iter__(self) -> Iterator[Tuple[bytes, bytes]]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        return f"Headers({self.raw!r})"
+
+    def to_headers(self) -> list[Tuple[bytes, bytes]]:
+        return self.raw
+
+
+class HeaderTemplate:
+    """Headers encoded once and shared by many responses, overridden by a response's own headers."""
+
+    __slots__ = ("raw", "names")
+
+    def __init__(self, headers: Mapping[str, str] | Iterable[Tuple[str | bytes, str | bytes]]) -> None:
+        items = headers.items() if isinstance(headers, Mapping) else headers
+        self.raw: Tuple[Tuple[bytes, bytes], ...] = tuple((encode(name).lower(), encode(value)) for name, value in items)
+        self.names: frozenset[bytes] = frozenset(name for name, _ in self.raw)
+
+    def extend(self, headers: Mapping[str, str] | Iterable[Tuple[str | bytes, str | bytes]]) -> "HeaderTemplate":
+        """New template with additional headers, replacing those of the same name."""
+        return HeaderTemplate(self.merge(Headers(HeaderTemplate(headers).raw)))
+
+    def merge(self, headers: Headers) -> Sequence[Tuple[bytes, bytes]]:
+        own = headers.raw
+        if not own:
+            return self.raw
+        names = self.names
+        if any(name in names for name, _ in own):
+            replaced = {name for name, _ in own}
+            return [header for header in self.raw if header[0] not in replaced] + own
+        return [*self.raw, *own]
+
+    def __repr__(self) -> str:
+        return f"HeaderTemplate({self.raw!r})"
+
+
+PLAIN_TEXT = HeaderTemplate({"content-type": "text/plain; charset=utf-8"})
+JSON = HeaderTemplate({"content-type": "application/json"})
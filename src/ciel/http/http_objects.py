@@ -1,19 +1,59 @@
 from collections import defaultdict
-from typing import Optional, Any, Tuple, Iterable, Dict
-from urllib.parse import quote, unquote
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Optional, Any, Tuple, Iterable, Dict, Sequence
+from urllib.parse import quote, unquote, unquote_plus
 
 from ciel.asgi.typing import HTTPScope, ASGIVersions, ASGIReceiveCallable, ASGISendCallable
+from .errors import ClientDisconnect, HttpError, PayloadTooLarge
+from .forms import FormData, FormLimits, parse_form
+from .headers import Headers, HeaderTemplate
+from .json import JsonBackend, default_backend
+
+MISSING: Any = object()
+
+# Longer query strings are parsed every time rather than memoised.
+QUERY_CACHE_MAX_LENGTH = 1024
+
+
+def parse_query_string(data: bytes) -> Dict[str, list[Optional[str]]]:
+    """Parse a query string into lists of values by name, `None` for a name without `=`."""
+    res: Dict[str, list[Optional[str]]] = {}
+    if not data:
+        return res
+    text = data.decode("utf-8", "replace")
+    escaped = b"%" in data or b"+" in data
+    for pair in text.split("&"):
+        if not pair:
+            continue
+        name, eq, value = pair.partition("=")
+        if escaped:
+            if "%" in name or "+" in name:
+                name = unquote_plus(name)
+            if "%" in value or "+" in value:
+                value = unquote_plus(value)
+        values = res.get(name)
+        if values is None:
+            res[name] = values = []
+        values.append(value if eq else None)
+    return res
+
+
+@lru_cache(maxsize=1024)
+def cached_query_string(data: bytes) -> "HttpData":
+    # Shared between requests: tuples behind a read-only mapping, so that no caller can alter another's data.
+    frozen = MappingProxyType({name: tuple(values) for name, values in parse_query_string(data).items()})
+    return HttpData(frozen, True, False)  # type: ignore
 
 
 class HttpData:
 
     @staticmethod
     def from_query_string(data: bytes, readonly: bool = True) -> "HttpData":
-        res: Dict[str, list[Optional[str]]] = defaultdict(list)
-        for group in data.split(b"&"):
-            kv = group.split(b"=", 1)
-            res[unquote(kv[0].strip())].append(None if len(kv) == 1 else unquote(kv[1].strip()))
-        return HttpData(res, readonly, False)
+        """Parse a query string; read-only results are shared and must not be modified."""
+        if readonly and len(data) <= QUERY_CACHE_MAX_LENGTH:
+            return cached_query_string(data)
+        return HttpData(defaultdict(list, parse_query_string(data)), readonly, False)
 
     @staticmethod
     def from_headers(data: Iterable[Tuple[bytes, bytes]], readonly: bool = True) -> "HttpData":
@@ -80,7 +120,8 @@ class Request:
         await res.fetch_body(receive)
         return res
 
-    def __init__(self, scope: HTTPScope) -> None:
+    def __init__(self, scope: HTTPScope, receive: Optional[ASGIReceiveCallable] = None,
+                 max_body_size: Optional[int] = None, json_backend: Optional[JsonBackend] = None) -> None:
         self.asgi: ASGIVersions = scope["asgi"]
         self.http_version: str = scope["http_version"]
         self.method: str = scope["method"]
@@ -88,42 +129,120 @@ class Request:
         self.path: str = scope["path"]
         self.raw_path: Optional[bytes] = scope.get("raw_path")
         self.query_string: bytes = scope["query_string"]
-        self.query_data: HttpData = HttpData.from_query_string(self.query_string)
         self.root_path: str = scope.get("root_path", "")
         self.headers_raw: Iterable[Tuple[bytes, bytes]] = scope["headers"]
-        self.headers: HttpData = HttpData.from_headers(self.headers_raw)
         self.client: Optional[Tuple[str, int]] = scope.get("client")
         self.server: Optional[Tuple[str, Optional[int]]] = scope.get("server")
         self.state: Optional[Dict[str, Any]] = scope.get("state")
         self.extensions: Optional[Dict[str, Dict[object, object]]] = scope.get("extensions")
         self.body: bytes = b""
+        self.path_params: Dict[str, Any] = {}
+        self.receive: Optional[ASGIReceiveCallable] = receive
+        self.max_body_size: Optional[int] = max_body_size
+        self.body_loaded: bool = False
+        self.stream_consumed: bool = False
+        self.json_backend: JsonBackend = json_backend or default_backend()
+        self.json_data: Any = MISSING
+        self.form_data: Optional[FormData] = None
+
+    @cached_property
+    def query_data(self) -> HttpData:
+        """Query string parameters, parsed on first access."""
+        return HttpData.from_query_string(self.query_string)
+
+    @cached_property
+    def headers(self) -> Headers:
+        """Request headers, wrapping `headers_raw` on first access."""
+        return Headers(self.headers_raw, readonly=True)
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Iterate over the body chunks as they arrive, once; raises `ClientDisconnect` if the client leaves."""
+        if self.body_loaded:
+            if self.body:
+                yield self.body
+            return
+        if self.stream_consumed:
+            raise RuntimeError("The request body has already been consumed")
+        if self.receive is None:
+            raise RuntimeError("The request has no receive channel")
+        self.stream_consumed = True
+
+        limit = self.max_body_size
+        if limit is not None:
+            length = self.headers.get("content-length")
+            if length is not None and length.isdigit() and int(length) > limit:
+                raise PayloadTooLarge(limit)
+
+        size = 0
+        while True:
+            event = await self.receive()
+            if event["type"] != "http.request":
+                raise ClientDisconnect()
+            chunk = event.get("body", b"")
+            if chunk:
+                size += len(chunk)
+                if limit is not None and size > limit:
+                    raise PayloadTooLarge(limit)
+                yield chunk
+            if not event.get("more_body", False):
+                break
 
-    async def fetch_body(self, receive: ASGIReceiveCallable) -> None:
+    async def read(self) -> bytes:
+        """Load the whole body, once, and return it."""
+        if not self.body_loaded:
+            buffer = bytearray()
+            async for chunk in self.stream():
+                buffer += chunk
+            self.body = bytes(buffer)
+            self.body_loaded = True
+        return self.body
+
+    async def json(self) -> Any:
+        """Load the body and decode it as JSON, once."""
+        if self.json_data is MISSING:
+            try:
+                self.json_data = self.json_backend.loads(await self.read())
+            except ValueError as e:
+                raise HttpError(400, f"Invalid JSON body: {e}") from e
+        return self.json_data
+
+    async def form(self, limits: Optional[FormLimits] = None) -> FormData:
+        """Parse the body as a urlencoded or multipart form, once."""
+        if self.form_data is None:
+            self.form_data = await parse_form(self.headers.get("content-type", ""), self.stream(), limits)
+        return self.form_data
 
-        while (res := await receive())["type"] == "http.request":
-            self.body += res["body"]
-            if not res["more_body"]:
-                break
+    async def fetch_body(self, receive: ASGIReceiveCallable) -> None:
+        self.receive = receive
+        await self.read()
 
 
 class Response:
 
-    def __init__(self) -> None:
+    def __init__(self, template: Optional[HeaderTemplate] = None) -> None:
         self.status: int = 200
-        self.headers: HttpData = HttpData(case_insensitive=True)
+        self.template: Optional[HeaderTemplate] = template
+        self.headers: Headers = Headers()
         self.body: bytes = b""
 
-    async def send(self, send: ASGISendCallable):
+    def header_list(self) -> Sequence[Tuple[bytes, bytes]]:
+        if self.template is None:
+            return self.headers.raw
+        return self.template.merge(self.headers)
 
+    async def start(self, send: ASGISendCallable) -> None:
         await send({
             "type": "http.response.start",
             "status": self.status,
-            "headers": self.headers.to_headers(),
+            "headers": self.header_list(),
             "trailers": False
         })
 
+    async def send(self, send: ASGISendCallable, extensions: Optional[Dict[str, Dict[object, object]]] = None) -> None:
+        await self.start(send)
+
         await send({
             "type": "http.response.body",
             "body": self.body,
             "more_body": False,
-        })
\ No newline at end of file
+        })
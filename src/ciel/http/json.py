@@ -0,0 +1,69 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore
+
+
+class JsonBackend:
+    """JSON encoder and decoder of bodies, using the standard library; decoding errors are ValueErrors."""
+
+    name: str = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecBackend(JsonBackend):
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        self.encoder: Any = msgspec.json.Encoder()
+        self.decoder: Any = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self.encoder.encode(value)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self.decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+def detect_backend() -> JsonBackend:
+    """The fastest backend installed: orjson, then msgspec, then the standard library."""
+    if orjson is not None:
+        return OrjsonBackend()
+    if msgspec is not None:
+        return MsgspecBackend()
+    return JsonBackend()
+
+
+DEFAULT_BACKEND: JsonBackend = detect_backend()
+
+
+def default_backend() -> JsonBackend:
+    return DEFAULT_BACKEND
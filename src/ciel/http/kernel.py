@@ -0,0 +1,56 @@
+from typing import Awaitable, Callable, Optional
+
+from ciel import Application
+from ciel.asgi.typing import HTTPScope, ASGIReceiveCallable, ASGISendCallable
+from ciel.core.dependency_injection.container import BindingIdentifier
+from .errors import ClientDisconnect, HttpError
+from .headers import PLAIN_TEXT
+from .http_objects import Request, Response
+from .json import JsonBackend, default_backend
+from .responses import JSONResponse
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+async def not_found(request: Request) -> Response:
+    response = Response(PLAIN_TEXT)
+    response.status = 404
+    response.body = b"Not Found"
+    return response
+
+
+def error_response(error: HttpError) -> Response:
+    response = Response(PLAIN_TEXT)
+    response.status = error.status
+    response.body = error.detail.encode()
+    return response
+
+
+class HttpKernel:
+    """ASGI application of the "http" scope: calls the handler in a container scope binding the request."""
+
+    def __init__(self, app: Application) -> None:
+        self.app: Application = app
+        self.handler: Handler = not_found
+        self.request_id: BindingIdentifier[Request] = BindingIdentifier.of(Request)
+        self.max_body_size: Optional[int] = None
+        self.json_backend: JsonBackend = default_backend()
+
+    async def __call__(self, scope: HTTPScope, receive: ASGIReceiveCallable, send: ASGISendCallable) -> None:
+        request = Request(scope, receive, self.max_body_size, self.json_backend)
+        # The response is sent within the scope: streamed bodies may still use request-scoped bindings.
+        with self.app.scope() as request_scope:
+            request_scope.instances[self.request_id] = request
+            try:
+                try:
+                    response = await self.handler(request)
+                except HttpError as e:
+                    response = error_response(e)
+                if isinstance(response, JSONResponse):
+                    response.encode(self.json_backend)
+                await response.send(send, request.extensions)
+            except ClientDisconnect:
+                pass
+            finally:
+                if request.form_data is not None:
+                    await request.form_data.close()
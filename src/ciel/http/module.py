@@ -1,12 +1,33 @@
+from typing import Optional
+
 from ciel import Application
 from ciel.core.module import Module, ModuleManifest
+from .http_objects import Request
+from .json import JsonBackend, default_backend
+from .kernel import HttpKernel
+from .routing import Router
+
+
+def no_request() -> Request:
+    raise RuntimeError("The request is only bound while it is being handled")
+
 
 class HttpModule(Module):
 
-    def __init__(self) -> None:
+    def __init__(self, max_body_size: Optional[int] = None) -> None:
         super().__init__(
             ModuleManifest("http", (0,0,1))
         )
+        self.max_body_size: Optional[int] = max_body_size
 
     def register(self, app: Application) -> None:
-        pass
\ No newline at end of file
+        app.scoped(Request, no_request)
+        app.singleton(HttpKernel)
+        app.singleton(Router)
+        app.singleton(JsonBackend, default_backend)
+
+    def boot(self, app: Application, kernel: HttpKernel, router: Router, json: JsonBackend) -> None:
+        kernel.handler = router
+        kernel.max_body_size = self.max_body_size
+        kernel.json_backend = json
+        app.handle("http", kernel)
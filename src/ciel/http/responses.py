@@ -0,0 +1,128 @@
+import asyncio
+import mimetypes
+import os
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional, TypeVar
+
+from ciel.asgi.typing import ASGISendCallable
+from .headers import JSON, HeaderTemplate
+from .http_objects import Response
+from .json import JsonBackend, default_backend
+
+T = TypeVar("T")
+
+PATHSEND = "http.response.pathsend"
+
+
+async def iterate_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Iterate over a blocking iterator from a worker thread, one item at a time."""
+    done = object()
+    try:
+        while (item := await asyncio.to_thread(next, iterator, done)) is not done:
+            yield item  # type: ignore
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+class JSONResponse(Response):
+    """Response with a JSON body, encoded by `backend`, or by the kernel's `JsonBackend` when it is sent."""
+
+    def __init__(self, content: Any, status: int = 200, backend: Optional[JsonBackend] = None,
+                 template: HeaderTemplate = JSON) -> None:
+        super().__init__(template)
+        self.status = status
+        self.content: Any = content
+        self.backend: Optional[JsonBackend] = None
+        if backend is not None:
+            self.encode(backend)
+
+    def encode(self, backend: JsonBackend) -> None:
+        """Encode the content with `backend`, unless it has already been encoded."""
+        if self.backend is None:
+            self.backend = backend
+            self.body = backend.dumps(self.content)
+
+    async def send(self, send: ASGISendCallable, extensions: Optional[Dict[str, Dict[object, object]]] = None) -> None:
+        self.encode(default_backend())
+        await super().send(send, extensions)
+
+
+class StreamingResponse(Response):
+    """Response sending the chunks of an iterator as they come, blocking iterators from a thread."""
+
+    def __init__(self, content: AsyncIterable[bytes | str] | Iterable[bytes | str], status: int = 200,
+                 content_type: Optional[str] = None) -> None:
+        super().__init__()
+        self.status = status
+        self.content: AsyncIterable[bytes | str] | Iterable[bytes | str] = content
+        if content_type is not None:
+            self.headers["content-type"] = content_type
+
+    def chunks(self) -> AsyncIterable[bytes | str]:
+        if isinstance(self.content, AsyncIterable):
+            return self.content
+        return iterate_in_thread(iter(self.content))
+
+    async def send(self, send: ASGISendCallable, extensions: Optional[Dict[str, Dict[object, object]]] = None) -> None:
+        await self.start(send)
+
+        async for chunk in self.chunks():
+            if not chunk:
+                continue
+            await send({
+                "type": "http.response.body",
+                "body": chunk.encode() if isinstance(chunk, str) else chunk,
+                "more_body": True,
+            })
+
+        await send({
+            "type": "http.response.body",
+            "body": b"",
+            "more_body": False,
+        })
+
+
+class FileResponse(Response):
+    """Response sending a file from disk, through `http.response.pathsend` when the server supports it."""
+
+    def __init__(self, path: str | os.PathLike[str], status: int = 200, content_type: Optional[str] = None,
+                 chunk_size: int = 64 * 1024) -> None:
+        super().__init__()
+        self.status = status
+        self.path: Path = Path(path).absolute()
+        self.chunk_size: int = chunk_size
+
+        if content_type is None:
+            content_type = mimetypes.guess_type(self.path.name)[0] or "application/octet-stream"
+        self.headers["content-type"] = content_type
+        self.headers["content-length"] = str(self.path.stat().st_size)
+
+    def read_chunks(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as file:
+            while chunk := file.read(self.chunk_size):
+                yield chunk
+
+    async def send(self, send: ASGISendCallable, extensions: Optional[Dict[str, Dict[object, object]]] = None) -> None:
+        await self.start(send)
+
+        if extensions is not None and PATHSEND in extensions:
+            await send({
+                "type": "http.response.pathsend",
+                "path": str(self.path),
+            })
+            return
+
+        async for chunk in iterate_in_thread(self.read_chunks()):
+            await send({
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": True,
+            })
+
+        await send({
+            "type": "http.response.body",
+            "body": b"",
+            "more_body": False,
+        })
@@ -0,0 +1,234 @@
+import re
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from ciel import Application
+from .http_objects import Request, Response
+from .kernel import Handler, not_found
+
+SLUG = re.compile(r"[A-Za-z0-9_]+(?:-[A-Za-z0-9_]+)*")
+# Canonical form only, so that a route matches a single spelling of each UUID.
+CANONICAL_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def convert_str(segment: str) -> str:
+    if not segment:
+        raise ValueError("Empty path segment")
+    return segment
+
+
+def convert_int(segment: str) -> int:
+    if not segment.isascii() or not segment.isdigit():
+        raise ValueError(f"Not an integer: {segment}")
+    return int(segment)
+
+
+def convert_uuid(segment: str) -> UUID:
+    if not CANONICAL_UUID.fullmatch(segment):
+        raise ValueError(f"Not a canonical UUID: {segment}")
+    return UUID(segment)
+
+
+def convert_slug(segment: str) -> str:
+    if not SLUG.fullmatch(segment):
+        raise ValueError(f"Not a slug: {segment}")
+    return segment
+
+
+CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "str": convert_str,
+    "int": convert_int,
+    "uuid": convert_uuid,
+    "slug": convert_slug,
+}
+
+Middleware = Callable[[Handler], Handler]
+
+PARAMETER = re.compile(r"\{(?P<name>[A-Za-z_][A-Za-z0-9_]*)(?::(?P<type>[a-z]+))?}")
+
+
+def split_path(path: str) -> list[str]:
+    if not path.startswith("/"):
+        raise ValueError(f"Path must start with a slash: {path}")
+    return path[1:].split("/")
+
+
+def under(path: str, prefix: str) -> bool:
+    prefix = prefix.rstrip("/")
+    return not prefix or path == prefix or path.startswith(prefix + "/")
+
+
+class Route:
+
+    def __init__(self, method: str, path: str, endpoint: Callable[..., Any], handler: Handler) -> None:
+        self.method: str = method
+        self.path: str = path
+        self.endpoint: Callable[..., Any] = endpoint
+        self.endpoint_handler: Handler = handler
+        self.handler: Handler = handler
+
+    def __repr__(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+class Node:
+    """Node of the routing tree, one level per path segment."""
+
+    __slots__ = ("static", "params", "routes")
+
+    def __init__(self) -> None:
+        self.static: dict[str, Node] = {}
+        self.params: list[tuple[str, str, Callable[[str], Any], Node]] = []
+        self.routes: dict[str, Route] = {}
+
+    def child(self, segment: str) -> "Node":
+        parameter = PARAMETER.fullmatch(segment)
+        if parameter is None:
+            if "{" in segment or "}" in segment:
+                raise ValueError(f"Invalid path segment: {segment}")
+            return self.static.setdefault(segment, Node())
+
+        name, kind = parameter.group("name"), parameter.group("type") or "str"
+        if kind not in CONVERTERS:
+            raise ValueError(f"Unknown path parameter type: {kind}")
+        for param_name, param_kind, _, node in self.params:
+            if param_name == name and param_kind == kind:
+                return node
+        node = Node()
+        self.params.append((name, kind, CONVERTERS[kind], node))
+        return node
+
+    def match(self, segments: list[str], index: int, params: dict[str, Any]) -> Optional["Node"]:
+        if index == len(segments):
+            return self if self.routes else None
+
+        segment = segments[index]
+        child = self.static.get(segment)
+        if child is not None:
+            res = child.match(segments, index + 1, params)
+            if res is not None:
+                return res
+
+        for name, _, convert, child in self.params:
+            try:
+                value = convert(segment)
+            except ValueError:
+                continue
+            res = child.match(segments, index + 1, params)
+            if res is not None:
+                params[name] = value
+                return res
+        return None
+
+
+class Router:
+    """Routes requests to endpoints by method and path, with `{name}` or `{name:type}` parameters."""
+
+    def __init__(self, app: Application) -> None:
+        self.app: Application = app
+        self.root: Node = Node()
+        self.routes: list[Route] = []
+        self.middlewares: list[tuple[str, Middleware]] = []
+        self.global_middlewares: list[Middleware] = []
+        self.handler: Handler = self.dispatch
+
+    def add(self, method: str, path: str, endpoint: Callable[..., Any]) -> Route:
+        node = self.root
+        for segment in split_path(path):
+            node = node.child(segment)
+
+        method = method.upper()
+        if method in node.routes:
+            raise ValueError(f"Route already defined: {method} {path}")
+
+        route = Route(method, path, endpoint, self.compile(endpoint))
+        self.link(route)
+        node.routes[method] = route
+        self.routes.append(route)
+        return route
+
+    def middleware(self, factory: Middleware, prefix: str = "") -> None:
+        """Add a middleware around the whole router, or only around the routes under `prefix`."""
+        if prefix.rstrip("/"):
+            split_path(prefix)
+            self.middlewares.append((prefix, factory))
+            for route in self.routes:
+                if under(route.path, prefix):
+                    self.link(route)
+        else:
+            self.global_middlewares.append(factory)
+            handler: Handler = self.dispatch
+            for global_factory in reversed(self.global_middlewares):
+                handler = global_factory(handler)
+            self.handler = handler
+
+    def link(self, route: Route) -> None:
+        handler = route.endpoint_handler
+        for prefix, factory in reversed(self.middlewares):
+            if under(route.path, prefix):
+                handler = factory(handler)
+        route.handler = handler
+
+    def compile(self, endpoint: Callable[..., Any]) -> Handler:
+        injector = self.app ^ endpoint
+
+        def handler(request: Request) -> Any:
+            return injector.call_async(**request.path_params)
+
+        return handler
+
+    def route(self, method: str, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        def decorator(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+            self.add(method, path, endpoint)
+            return endpoint
+
+        return decorator
+
+    def get(self, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return self.route("GET", path)
+
+    def post(self, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return self.route("POST", path)
+
+    def put(self, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return self.route("PUT", path)
+
+    def patch(self, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return self.route("PATCH", path)
+
+    def delete(self, path: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return self.route("DELETE", path)
+
+    def match(self, path: str) -> tuple[Optional[Node], dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if not path.startswith("/"):
+            return None, params
+        return self.root.match(path[1:].split("/"), 0, params), params
+
+    def lookup(self, method: str, path: str) -> tuple[Optional[Route], dict[str, Any]]:
+        node, params = self.match(path)
+        if node is None:
+            return None, params
+        return node.routes.get(method), params
+
+    def __call__(self, request: Request) -> Awaitable[Response]:
+        return self.handler(request)
+
+    async def dispatch(self, request: Request) -> Response:
+        node, params = self.match(request.path)
+        if node is None:
+            lazy = self.app.lazy_module_for(request.path) if self.app.lazy_routes else None
+            if lazy is not None:
+                await self.app.load_module_async(lazy)
+                return await self.dispatch(request)
+            return await not_found(request)
+
+        route = node.routes.get(request.method)
+        if route is None:
+            response = Response()
+            response.status = 405
+            response.headers["allow"] = ", ".join(node.routes)
+            return response
+
+        request.path_params = params
+        return await route.handler(request)
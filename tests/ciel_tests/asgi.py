@@ -0,0 +1,18 @@
+from typing import Optional
+
+
+def http_scope(path: str = "/", method: str = "GET", query_string: bytes = b"",
+               headers: Optional[list[tuple[bytes, bytes]]] = None, scheme: str = "http") -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": scheme,
+        "path": path,
+        "query_string": query_string,
+        "headers": headers if headers is not None else [],
+        "client": None,
+        "server": None,
+        "extensions": None,
+    }
@@ -0,0 +1,4 @@
+from . import test_dependency_injection
+from . import test_routing
+from . import test_http_objects
+from . import test_modules
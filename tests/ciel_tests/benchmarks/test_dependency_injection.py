@@ -0,0 +1,100 @@
+import unittest
+
+from ciel.core.dependency_injection.container import Container, BindingIdentifier  # type: ignore
+from .timing import benchmark, measure, report, report_counts
+
+
+class Service:
+    pass
+
+
+@benchmark
+class BenchmarkBindingLookup(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+        self.container.singleton(Service)
+        self.container.make(Service)
+
+    def test_lookup(self) -> None:
+        bindings = self.container.bindings
+
+        before = measure(lambda: bindings[BindingIdentifier(Service)])
+        after = measure(lambda: self.container.get_binding(Service))
+
+        report("Binding lookup by type", before=before, after=after)
+        self.assertLess(after, before)
+
+    def test_resolution(self) -> None:
+        container = self.container
+
+        def legacy() -> Service:
+            bind_id = BindingIdentifier(Service)
+            if bind_id in container.bindings:
+                return container.resolve(container.bindings[BindingIdentifier(Service)])
+            raise KeyError(bind_id.name)
+
+        before = measure(legacy)
+        after = measure(lambda: container.make(Service))
+
+        report("Singleton resolution by type", before=before, after=after)
+        self.assertLess(after, before)
+
+
+class Dep1:
+    pass
+
+
+class Dep2:
+    pass
+
+
+class Dep3:
+    pass
+
+
+class Dep4:
+    pass
+
+
+class Dep5:
+    pass
+
+
+def controller(d1: Dep1, d2: Dep2, d3: Dep3, d4: Dep4, d5: Dep5) -> None:
+    pass
+
+
+@benchmark
+class BenchmarkInjection(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+        for dep in (Dep1, Dep2, Dep3, Dep4, Dep5):
+            self.container.singleton(dep)
+        self.deps = [self.container.make(dep) for dep in (Dep1, Dep2, Dep3, Dep4, Dep5)]
+
+    def test_controller(self) -> None:
+        injector = self.container ^ controller
+        deps = self.deps
+
+        plain = measure(lambda: controller(*deps))
+        compiled = measure(injector)
+        self.container.freeze()
+        frozen = measure(injector)
+
+        report("Controller with 5 singleton dependencies", plain=plain, compiled=compiled, frozen=frozen)
+        report_counts("Controller cost relative to a plain call", compiled=compiled / plain, frozen=frozen / plain)
+        # Built singletons are bound into the plan: what remains is the injector's own call.
+        self.assertLess(compiled, plain * 5)
+        self.assertLess(frozen, plain * 5)
+
+    def test_make(self) -> None:
+        container = self.container
+
+        before = measure(lambda: container.make(Dep1))
+        container.freeze()
+        after = measure(lambda: container.make(Dep1))
+
+        report("Container.make of a singleton", before=before, frozen=after)
+        self.assertLess(after, before)
@@ -0,0 +1,88 @@
+import tracemalloc
+import unittest
+from typing import Callable, Any
+from urllib.parse import parse_qsl
+
+from ciel.http import Request
+from ciel.http.http_objects import HttpData, parse_query_string
+from ..asgi import http_scope
+from .timing import benchmark, measure, report, report_counts
+
+
+HEADERS = [
+    (b"host", b"example.com"),
+    (b"user-agent", b"Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"),
+    (b"accept", b"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"),
+    (b"accept-language", b"en-US,en;q=0.5"),
+    (b"accept-encoding", b"gzip, deflate, br, zstd"),
+    (b"connection", b"keep-alive"),
+    (b"cookie", b"session=0123456789abcdef; theme=dark; consent=yes"),
+    (b"upgrade-insecure-requests", b"1"),
+    (b"sec-fetch-dest", b"document"),
+    (b"sec-fetch-mode", b"navigate"),
+    (b"sec-fetch-site", b"none"),
+    (b"sec-fetch-user", b"?1"),
+    (b"priority", b"u=0, i"),
+    (b"x-forwarded-for", b"203.0.113.7"),
+    (b"x-request-id", b"f0e1d2c3-b4a5-9687-7869-5a4b3c2d1e0f"),
+]
+
+
+def scope() -> dict:
+    return {
+        **http_scope("/health", query_string=b"page=2&per_page=50&sort=name&order=asc&filter=active",
+                     headers=HEADERS, scheme="https"),
+        "client": ("203.0.113.7", 51234),
+        "server": ("example.com", 443),
+        "extensions": {},
+    }
+
+
+def allocations(fn: Callable[[], Any], number: int = 1_000) -> float:
+    """Average number of memory blocks still allocated per call, results kept alive."""
+    results = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(number):
+            results.append(fn())
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename")) / number
+
+
+@benchmark
+class BenchmarkRequest(unittest.TestCase):
+
+    def test_request(self) -> None:
+        data = scope()
+
+        def parsed() -> Request:
+            request = Request(data)
+            request.headers, request.query_data
+            return request
+
+        def untouched() -> Request:
+            return Request(data)
+
+        report("Request construction", parsed=measure(parsed), untouched=measure(untouched))
+        before, after = allocations(parsed), allocations(untouched)
+        report_counts("Memory blocks allocated per request", parsed=before, untouched=after)
+        self.assertLess(after, before)
+
+
+@benchmark
+class BenchmarkQueryString(unittest.TestCase):
+
+    def test_query_string(self) -> None:
+        for title, data in (
+                ("Plain query string", b"page=2&per_page=50&sort=name&order=asc&filter=active"),
+                ("Escaped query string", b"q=caf%C3%A9+au+lait&tags=a%2Cb&page=2&sort=-created_at"),
+        ):
+            report(
+                title,
+                parse_qsl=measure(lambda: parse_qsl(data.decode(), keep_blank_values=True)),
+                parse_query_string=measure(lambda: parse_query_string(data)),
+                memoised=measure(lambda: HttpData.from_query_string(data)),
+            )
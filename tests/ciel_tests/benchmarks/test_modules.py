@@ -0,0 +1,82 @@
+import random
+import unittest
+from collections import defaultdict
+
+from ciel.core.module import Module, ModuleManifest, ModuleRegister
+from .timing import benchmark, measure, report
+
+
+def synthetic_modules(count: int, seed: int = 0) -> list[Module]:
+    """
+    A few core modules, then tenant or plugin modules depending on up to 2 of them and, for some, on another tenant
+    module: a wide graph, as generated per tenant.
+    """
+    rng = random.Random(seed)
+    core = [ModuleManifest(f"core_{i}") for i in range(20)]
+    manifests: list[ModuleManifest] = list(core)
+    for i in range(len(core), count):
+        dependencies = set(rng.sample(core, rng.randint(0, 2)))
+        if rng.random() < 0.2:
+            dependencies.add(rng.choice(manifests[len(core):] or core))
+        manifests.append(ModuleManifest(f"module_{i}", dependencies=dependencies))
+    modules = [Module(m) for m in manifests]
+    rng.shuffle(modules)
+    return modules
+
+
+def list_sort(modules: list[Module]) -> list[Module]:
+    """The previous sort: `pop(0)` on a list of roots and a final scan of every edge set."""
+    indexed = {m.manifest: m for m in modules}
+    in_edges = defaultdict(set)
+    out_edges = defaultdict(set)
+    roots: list[ModuleManifest] = []
+    for m in indexed.keys():
+        if len(m.dependencies):
+            for dep in m.dependencies:
+                in_edges[m].add(dep)
+                out_edges[dep].add(m)
+        else:
+            roots.append(m)
+
+    res: list[Module] = []
+    while len(roots) > 0:
+        n = roots.pop(0)
+        res.append(indexed[n])
+        for m in list(out_edges[n]):
+            out_edges[n].remove(m)
+            in_edges[m].remove(n)
+            if len(in_edges[m]) == 0:
+                roots.append(m)
+
+    if any((len(in_edges[m]) > 0 or len(out_edges[m]) > 0) for m in indexed.keys()):
+        raise RuntimeError("Cycle in module dependencies")
+    return res
+
+
+@benchmark
+class BenchmarkModuleRegister(unittest.TestCase):
+
+    def test_sort(self) -> None:
+        modules = synthetic_modules(10_000)
+
+        before = measure(lambda: list_sort(modules), number=1, repeat=3)
+        after = measure(lambda: ModuleRegister(modules), number=1, repeat=3)
+
+        # Both are linear on such graphs, `pop(0)` moving few roots; the register also checks versions.
+        report("Sort of 10k modules", before=before, after=after)
+
+    def test_incremental(self) -> None:
+        modules = synthetic_modules(10_000)
+        last = next(m for m in modules if m.manifest.name == "module_9999")
+        base = [m for m in modules if m is not last]
+        register = ModuleRegister(base)
+
+        def add_remove() -> None:
+            register.add(last)
+            register.remove(last)
+
+        rebuild = measure(lambda: ModuleRegister(modules), number=1, repeat=3)
+        incremental = measure(add_remove, number=10, repeat=3)
+
+        report("Adding a module to 10k modules", rebuild=rebuild, incremental=incremental)
+        self.assertLess(incremental, rebuild)
@@ -0,0 +1,35 @@
+import unittest
+from pathlib import Path
+
+from ciel import Application
+from ciel.http import HttpModule, Response, Router
+from .timing import benchmark, measure, report
+
+
+def endpoint() -> Response:
+    return Response()
+
+
+def build_router(size: int) -> Router:
+    router = Application(Path("."), [HttpModule()])[Router]
+    for i in range(size // 4):
+        router.add("GET", f"/resource{i}", endpoint)
+        router.add("GET", f"/resource{i}/{{id:int}}", endpoint)
+        router.add("POST", f"/resource{i}/{{id:int}}/items", endpoint)
+        router.add("GET", f"/resource{i}/{{id:int}}/items/{{slug:slug}}", endpoint)
+    return router
+
+
+@benchmark
+class BenchmarkRouting(unittest.TestCase):
+
+    def test_lookup(self) -> None:
+        timings = {}
+        for size in (1_000, 10_000):
+            router = build_router(size)
+            last = size // 4 - 1
+            timings[f"static {size}"] = measure(lambda: router.lookup("GET", f"/resource{last}"))
+            timings[f"nested {size}"] = measure(lambda: router.lookup("GET", f"/resource{last}/42/items/some-slug"))
+
+        report("Route lookup", **timings)
+        self.assertLess(timings["nested 10000"], timings["nested 1000"] * 2)
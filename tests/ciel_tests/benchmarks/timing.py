@@ -0,0 +1,25 @@
+import os
+import timeit
+import unittest
+from typing import Callable, Any
+
+enabled = bool(os.environ.get("CIEL_BENCHMARK"))
+
+benchmark = unittest.skipUnless(enabled, "set CIEL_BENCHMARK=1 to run benchmarks")
+
+
+def measure(fn: Callable[[], Any], number: int = 10_000, repeat: int = 5) -> float:
+    """Best per-call time of fn, in seconds."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def report(title: str, **timings: float) -> None:
+    print(f"\n{title}")
+    for name, seconds in timings.items():
+        print(f"  {name:<24} {seconds * 1e9:>10.1f} ns")
+
+
+def report_counts(title: str, **counts: float) -> None:
+    print(f"\n{title}")
+    for name, count in counts.items():
+        print(f"  {name:<24} {count:>10.1f}")
@@ -1,2 +1,4 @@
 from . import dependency_injection
 from . import module
+from . import test_application
+from . import test_tracing
@@ -1,2 +1,3 @@
 from . import test_container
 from . import test_injector
+from . import test_graph
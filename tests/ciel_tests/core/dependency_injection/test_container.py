@@ -1,4 +1,10 @@
+import asyncio
+import gc
+import threading
+import time
 import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from ciel.core.dependency_injection.container import Container, BindingIdentifier  # type: ignore
 
 
@@ -29,6 +35,21 @@ class TestBindingIdentifier(unittest.TestCase):
         self.assertEqual(hash(id_a_1), hash(id_a_2))
         self.assertNotEqual(hash(id_a_1), hash(id_b))
 
+    def test_interned(self) -> None:
+        self.assertIs(BindingIdentifier.of(A), BindingIdentifier.of(A))
+        self.assertEqual(BindingIdentifier.of(A), BindingIdentifier(A))
+        self.assertIsNot(BindingIdentifier.of(A), BindingIdentifier.of(B))
+
+    def test_interned_is_weak(self) -> None:
+        class Dummy:
+            pass
+
+        BindingIdentifier.of(Dummy)
+        reference = weakref.ref(Dummy)
+        del Dummy
+        gc.collect()
+        self.assertIsNone(reference())
+
 
 class TestContainer(unittest.TestCase):
     def setUp(self) -> None:
@@ -128,6 +149,22 @@ class TestContainer(unittest.TestCase):
         self.container[Dummy] = obj
         self.assertIs(self.container[Dummy], obj)
 
+    def test_rebind_same_name(self) -> None:
+        def make_class() -> type:
+            class Dummy:
+                pass
+            return Dummy
+
+        first = make_class()
+        second = make_class()
+
+        self.container.transient(first)
+        self.container.transient(second)
+
+        self.assertIsInstance(self.container.make(first), second)
+        self.assertIsInstance(self.container.make(second), second)
+        self.assertTrue(self.container.is_bound(first))
+
     def test_injection(self) -> None:
         class Dummy1:
             def __init__(self, test: int = 1) -> None:
@@ -142,3 +179,375 @@ class TestContainer(unittest.TestCase):
         instance = self.container.make(Dummy2)
 
         self.assertEqual(instance.test.test, 2)
+
+
+class Session:
+    pass
+
+
+class TestScopedContainer(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+        self.container.scoped(Session, aliases=["session"])
+
+    def test_same_instance_within_scope(self) -> None:
+        with self.container.scope():
+            self.assertIs(self.container.make(Session), self.container.make("session"))
+
+    def test_new_instance_per_scope(self) -> None:
+        with self.container.scope():
+            instance1 = self.container.make(Session)
+        with self.container.scope():
+            instance2 = self.container.make(Session)
+
+        self.assertIsNot(instance1, instance2)
+
+    def test_no_active_scope(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.container.make(Session)
+
+        with self.container.scope():
+            pass
+
+        with self.assertRaises(RuntimeError):
+            self.container.make(Session)
+
+    def test_released_on_exit(self) -> None:
+        with self.container.scope() as scope:
+            self.container.make(Session)
+            self.assertEqual(len(scope.instances), 1)
+        self.assertEqual(len(scope.instances), 0)
+
+    def test_nested_scope_is_isolated(self) -> None:
+        with self.container.scope():
+            outer = self.container.make(Session)
+            with self.container.scope():
+                self.assertIsNot(self.container.make(Session), outer)
+            self.assertIs(self.container.make(Session), outer)
+
+    def test_scopes_of_other_containers(self) -> None:
+        other = Container()
+        other.scoped(Session)
+        with self.container.scope():
+            outer = self.container.make(Session)
+            with other.scope():
+                self.assertIs(self.container.make(Session), outer)
+                self.assertIsNot(other.make(Session), outer)
+        with other.scope():
+            with self.assertRaises(RuntimeError):
+                self.container.make(Session)
+
+    def test_instance(self) -> None:
+        obj = Session()
+        with self.container.scope():
+            self.container[Session] = obj
+            self.assertIs(self.container[Session], obj)
+
+        with self.container.scope():
+            self.assertIsNot(self.container[Session], obj)
+
+    def test_injection(self) -> None:
+        class Repository:
+            def __init__(self, session: Session) -> None:
+                self.session = session
+
+        self.container.transient(Repository)
+        with self.container.scope():
+            repo1 = self.container.make(Repository)
+            repo2 = self.container.make(Repository)
+            self.assertIsNot(repo1, repo2)
+            self.assertIs(repo1.session, repo2.session)
+
+    async def test_concurrent_tasks_are_isolated(self) -> None:
+        async def request() -> tuple[Session, Session]:
+            with self.container.scope():
+                first = self.container.make(Session)
+                await asyncio.sleep(0)
+                return first, self.container.make(Session)
+
+        results = await asyncio.gather(*[request() for _ in range(10)])
+
+        for first, second in results:
+            self.assertIs(first, second)
+        self.assertEqual(len({id(first) for first, _ in results}), 10)
+
+
+class TestAsyncContainer(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+
+    async def test_async_builder(self) -> None:
+        async def build() -> A:
+            await asyncio.sleep(0)
+            return A()
+
+        self.container.transient(A, build)
+        self.assertIsInstance(await self.container.make_async(A), A)
+
+    async def test_sync_make_of_async_binding(self) -> None:
+        async def build() -> A:
+            return A()
+
+        self.container.transient(A, build)
+        with self.assertRaises(TypeError):
+            self.container.make(A)
+
+    async def test_sync_binding_with_make_async(self) -> None:
+        self.container.singleton(A)
+        self.assertIs(await self.container.make_async(A), self.container.make(A))
+
+    async def test_async_dependency(self) -> None:
+        class Pool:
+            pass
+
+        class Repository:
+            def __init__(self, pool: Pool) -> None:
+                self.pool = pool
+
+        async def connect() -> Pool:
+            await asyncio.sleep(0)
+            return Pool()
+
+        self.container.singleton(Pool, connect)
+        self.container.transient(Repository)
+
+        self.assertTrue(self.container.is_async(self.container.get_binding(Repository)))
+        repo = await self.container.make_async(Repository)
+        self.assertIs(repo.pool, await self.container.make_async(Pool))
+
+        # Once built, the singleton is available synchronously.
+        self.assertIs(self.container.make(Repository).pool, repo.pool)
+
+    async def test_singleton_built_once(self) -> None:
+        builds = 0
+
+        async def build() -> A:
+            nonlocal builds
+            builds += 1
+            await asyncio.sleep(0.01)
+            return A()
+
+        self.container.singleton(A, build)
+        results = await asyncio.gather(*[self.container.make_async(A) for _ in range(20)])
+
+        self.assertEqual(builds, 1)
+        self.assertTrue(all(res is results[0] for res in results))
+
+    async def test_failed_singleton_build_is_retried(self) -> None:
+        attempts = 0
+
+        async def build() -> A:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise ConnectionError()
+            return A()
+
+        self.container.singleton(A, build)
+        with self.assertRaises(ConnectionError):
+            await self.container.make_async(A)
+        self.assertIsInstance(await self.container.make_async(A), A)
+
+    async def test_scoped_built_once_per_scope(self) -> None:
+        builds = 0
+
+        async def build() -> Session:
+            nonlocal builds
+            builds += 1
+            await asyncio.sleep(0)
+            return Session()
+
+        self.container.scoped(Session, build)
+        with self.container.scope():
+            first, second = await asyncio.gather(self.container.make_async(Session),
+                                                 self.container.make_async(Session))
+            self.assertIs(first, second)
+        with self.container.scope():
+            self.assertIsNot(await self.container.make_async(Session), first)
+        self.assertEqual(builds, 2)
+
+    async def test_independent_dependencies_resolved_concurrently(self) -> None:
+        both_started = asyncio.Barrier(2)
+
+        async def build_a() -> A:
+            await both_started.wait()
+            return A()
+
+        async def build_b() -> B:
+            await both_started.wait()
+            return B()
+
+        async def handler(a: A, b: B) -> tuple[A, B]:
+            return a, b
+
+        self.container.transient(A, build_a)
+        self.container.transient(B, build_b)
+
+        a, b = await asyncio.wait_for((self.container ^ handler).call_async(), 1)
+        self.assertIsInstance(a, A)
+        self.assertIsInstance(b, B)
+
+
+class TestThreadedContainer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+
+    def test_singleton_built_once(self) -> None:
+        builds = 0
+        start = threading.Barrier(8)
+
+        def build() -> A:
+            nonlocal builds
+            builds += 1
+            time.sleep(0.01)
+            return A()
+
+        def worker() -> A:
+            start.wait()
+            return self.container.make(A)
+
+        self.container.singleton(A, build)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: worker(), range(8)))
+
+        self.assertEqual(builds, 1)
+        self.assertTrue(all(res is results[0] for res in results))
+
+    def test_unrelated_singletons_do_not_wait(self) -> None:
+        b_built = threading.Event()
+
+        def build_a() -> A:
+            # Only returns once B has been built by another thread.
+            self.assertTrue(b_built.wait(1))
+            return A()
+
+        def build_b() -> B:
+            return B()
+
+        self.container.singleton(A, build_a)
+        self.container.singleton(B, build_b)
+        with ThreadPoolExecutor(2) as executor:
+            a = executor.submit(self.container.make, A)
+            executor.submit(self.container.make, B).result()
+            b_built.set()
+            self.assertIsInstance(a.result(), A)
+
+    def test_none_singleton(self) -> None:
+        builds = 0
+
+        def build() -> None:
+            nonlocal builds
+            builds += 1
+
+        self.container.singleton(A, build)
+        self.assertIsNone(self.container.make(A))
+        self.assertIsNone(self.container.make(A))
+        self.assertEqual(builds, 1)
+
+
+class TestFrozenContainer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+
+    def test_singletons_built_on_freeze(self) -> None:
+        builds = 0
+
+        def build() -> A:
+            nonlocal builds
+            builds += 1
+            return A()
+
+        self.container.singleton(A, build, aliases=["a"])
+        self.container.freeze()
+        self.assertEqual(builds, 1)
+        self.assertIs(self.container.make(A), self.container.make("a"))
+        self.assertEqual(builds, 1)
+
+    def test_transient(self) -> None:
+        class Repository:
+            def __init__(self, a: A, b: B) -> None:
+                self.a = a
+                self.b = b
+
+        self.container.singleton(A)
+        self.container.transient(B)
+        self.container.transient(Repository)
+        self.container.freeze()
+
+        repo1 = self.container.make(Repository)
+        repo2 = self.container.make(Repository)
+        self.assertIsNot(repo1, repo2)
+        self.assertIs(repo1.a, repo2.a)
+        self.assertIsNot(repo1.b, repo2.b)
+
+    def test_missing_parameters(self) -> None:
+        class Dummy:
+            def __init__(self, value, a: A) -> None:  # type: ignore
+                self.value = value
+                self.a = a
+
+        self.container.singleton(A)
+        self.container.transient(Dummy)
+        with self.assertRaises(ValueError):
+            self.container.freeze()
+        self.assertFalse(self.container.frozen)
+        self.assertEqual(self.container.make(Dummy, 1).value, 1)
+        with self.assertRaises(ValueError):
+            self.container.compile_factory(self.container.get_binding(Dummy))
+
+    def test_injection_uses_table(self) -> None:
+        def handler(a: A) -> A:
+            return a
+
+        self.container.singleton(A)
+        injector = self.container ^ handler
+        self.container.freeze()
+
+        self.assertIs(injector(), self.container.make(A))
+        self.assertIs(injector.plan(0, ()).positional[0], self.container.table[A])
+
+    def test_bind_after_freeze(self) -> None:
+        self.container.freeze()
+        with self.assertRaises(RuntimeError):
+            self.container.transient(A)
+
+    def test_instance_after_freeze(self) -> None:
+        self.container.singleton(A)
+        self.container.scoped(Session)
+        self.container.freeze()
+        with self.assertRaises(RuntimeError):
+            self.container[A] = A()
+
+        with self.container.scope():
+            session = Session()
+            self.container[Session] = session
+            self.assertIs(self.container[Session], session)
+
+    def test_unresolved_annotation(self) -> None:
+        class Dummy:
+            def __init__(self, a: A) -> None:
+                self.a = a
+
+        self.container.transient(Dummy)
+        with self.assertRaises(ValueError) as context:
+            self.container.freeze()
+        self.assertIn("Dummy (a)", str(context.exception))
+        self.assertFalse(self.container.frozen)
+
+        self.container.transient(A)
+        self.container.freeze()
+        self.assertIsInstance(self.container.make(Dummy).a, A)
+
+    def test_failing_singleton(self) -> None:
+        def build() -> A:
+            raise ConnectionError()
+
+        self.container.singleton(A, build)
+        with self.assertRaises(ConnectionError):
+            self.container.freeze()
+        self.assertFalse(self.container.frozen)
+        self.assertEqual(self.container.table, {})
@@ -0,0 +1,130 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ciel.core.dependency_injection.container import Container, BindingIdentifier  # type: ignore
+
+
+class Config:
+    pass
+
+
+class Pool:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Cache:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Repository:
+    def __init__(self, pool: Pool, cache: Cache) -> None:
+        self.pool = pool
+        self.cache = cache
+
+
+class Left:
+    def __init__(self, right: "Right") -> None:
+        self.right = right
+
+
+class Right:
+    def __init__(self, left: Left) -> None:
+        self.left = left
+
+
+class TestDependencyGraph(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+
+    def bind_all(self) -> None:
+        self.container.singleton(Config)
+        self.container.singleton(Pool)
+        self.container.singleton(Cache)
+        self.container.transient(Repository)
+
+    def test_dependencies(self) -> None:
+        self.bind_all()
+        graph = self.container.graph()
+
+        self.assertEqual(graph.dependencies[BindingIdentifier.of(Repository)],
+                         {BindingIdentifier.of(Pool), BindingIdentifier.of(Cache)})
+        self.assertEqual(graph.dependencies[BindingIdentifier.of(Config)], set())
+        self.assertEqual(graph.missing, {})
+
+    def test_layers(self) -> None:
+        self.bind_all()
+        layers = self.container.graph().layers()
+
+        self.assertEqual(len(layers), 3)
+        self.assertEqual(layers[0], [BindingIdentifier.of(Config)])
+        self.assertEqual(set(layers[1]), {BindingIdentifier.of(Pool), BindingIdentifier.of(Cache)})
+        self.assertEqual(layers[2], [BindingIdentifier.of(Repository)])
+
+    def test_order(self) -> None:
+        self.bind_all()
+        order = self.container.graph().order()
+
+        self.assertLess(order.index(BindingIdentifier.of(Config)), order.index(BindingIdentifier.of(Pool)))
+        self.assertLess(order.index(BindingIdentifier.of(Pool)), order.index(BindingIdentifier.of(Repository)))
+        self.assertLess(order.index(BindingIdentifier.of(Cache)), order.index(BindingIdentifier.of(Repository)))
+
+    def test_missing(self) -> None:
+        self.container.transient(Repository)
+        graph = self.container.graph()
+
+        self.assertEqual(graph.missing, {BindingIdentifier.of(Repository): ["pool", "cache"]})
+        with self.assertRaises(ValueError) as context:
+            self.container.validate()
+        self.assertIn("Repository (pool, cache)", str(context.exception))
+
+    def test_missing_without_annotation(self) -> None:
+        class Client:
+            def __init__(self, url, timeout=10) -> None:
+                self.url = url
+
+        self.container.transient(Client)
+        self.assertEqual(self.container.graph().missing, {BindingIdentifier.of(Client): ["url"]})
+        with self.assertRaises(ValueError):
+            self.container.validate()
+
+    def test_instance_is_a_leaf(self) -> None:
+        self.container.singleton(Repository)
+        self.container[Repository] = Repository(Pool(Config()), Cache(Config()))
+        self.container.validate()
+
+    def test_cycle(self) -> None:
+        self.container.transient(Left, aliases=["left"])
+        self.container.transient(Right, aliases=["Right"])
+        graph = self.container.graph()
+
+        cycles = graph.cycles()
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(cycles[0][0], cycles[0][-1])
+        self.assertEqual(set(cycles[0]), {BindingIdentifier.of(Left), BindingIdentifier.of(Right)})
+
+        with self.assertRaises(RuntimeError) as context:
+            self.container.validate()
+        self.assertIn("Left", str(context.exception))
+        with self.assertRaises(RuntimeError):
+            graph.order()
+        with self.assertRaises(RuntimeError):
+            self.container.freeze()
+
+    def test_warm_up(self) -> None:
+        self.bind_all()
+        self.container.warm_up()
+
+        self.assertEqual(set(self.container.singletons),
+                         {BindingIdentifier.of(Config), BindingIdentifier.of(Pool), BindingIdentifier.of(Cache)})
+        self.assertIs(self.container[Pool].config, self.container[Cache].config)
+
+    def test_warm_up_with_executor(self) -> None:
+        self.bind_all()
+        with ThreadPoolExecutor(4) as executor:
+            self.container.warm_up(executor)
+
+        self.assertEqual(len(self.container.singletons), 3)
+        self.assertIs(self.container[Pool].config, self.container[Cache].config)
@@ -62,3 +62,102 @@ class TestInjector(unittest.TestCase):
         instance = injector()
         self.assertIsInstance(instance, A)
         self.assertEqual(instance.x, 42)
+
+    def test_plan_is_reused(self) -> None:
+        def func(a: int, b: str) -> tuple[int, str]:
+            return a, b
+
+        injector = Injector(self.container, func)
+        injector()
+        plan = injector.plan(0, {})
+        injector()
+        self.assertIs(injector.plan(0, {}), plan)
+        self.assertEqual(len(plan.positional), 2)
+        self.assertEqual(plan.keywords, [])
+
+    def test_plan_depends_on_call_shape(self) -> None:
+        def func(a: int, b: str) -> tuple[int, str]:
+            return a, b
+
+        injector = Injector(self.container, func)
+        self.assertEqual(injector(1), (1, "Hello"))
+        self.assertEqual(injector(b="World"), (42, "World"))
+        self.assertEqual(injector(), (42, "Hello"))
+        self.assertIsNot(injector.plan(1, {}), injector.plan(0, {}))
+
+    def test_plan_invalidated_on_bind(self) -> None:
+        def func(a: float = 1.0) -> float:
+            return a
+
+        injector = Injector(self.container, func)
+        self.assertEqual(injector(), 1.0)
+        plan = injector.plan(0, {})
+
+        self.container.singleton(float, lambda: 2.0)
+        self.assertEqual(injector(), 2.0)
+        self.assertIsNot(injector.plan(0, {}), plan)
+
+    def test_plan_binds_built_singletons(self) -> None:
+        class Service:
+            pass
+
+        def func(a: int, service: Service) -> tuple[int, Service]:
+            return a, service
+
+        self.container.singleton(Service)
+        injector = Injector(self.container, func)
+        self.assertIsNone(injector.plan(0, {}).bound)
+
+        service = self.container.make(Service)
+        self.assertEqual(injector(), (42, service))
+        self.assertEqual(injector.plan(0, {}).bound, (42, service))
+
+        self.container[int] = 7
+        self.assertEqual(injector(), (7, service))
+
+    def test_missing_parameter_plan_raises_every_call(self) -> None:
+        def func(a) -> int:  # type: ignore
+            return a  # type: ignore
+
+        injector = Injector(self.container, func)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                injector()
+
+
+class TestAsyncInjector(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.container = Container()
+        self.container.singleton(int)
+        self.container[int] = 42
+
+    async def test_coroutine_function(self) -> None:
+        async def func(a: int) -> int:
+            return a + 1
+
+        injector = Injector(self.container, func)
+        self.assertTrue(injector.coroutine)
+        self.assertEqual(await injector.call_async(), 43)
+
+    async def test_sync_function(self) -> None:
+        def func(a: int, b: int = 0) -> int:
+            return a + b
+
+        injector = Injector(self.container, func)
+        self.assertFalse(injector.plan(0, ()).asynchronous)
+        self.assertEqual(await injector.call_async(b=1), 43)
+
+    async def test_async_dependency(self) -> None:
+        async def build() -> str:
+            return "async"
+
+        def func(a: int, b: str) -> tuple[int, str]:
+            return a, b
+
+        self.container.transient(str, build)
+        injector = Injector(self.container, func)
+        plan = injector.plan(0, ())
+        self.assertTrue(plan.asynchronous)
+        self.assertEqual([slot for slot, _ in plan.pending], [1])
+        self.assertEqual(await injector.call_async(), (42, "async"))
@@ -1 +1,5 @@
 from . import test_register
+from . import test_version
+from . import test_resolver
+from . import test_lazy
+from . import test_discovery
@@ -0,0 +1,137 @@
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from ciel import Application
+from ciel.core.module import LazyModule, Requirement, discover
+
+EAGER = """
+from ciel.core.module import Module, ModuleManifest
+
+module = Module(ModuleManifest("eager", (1, 0, 0)))
+"""
+
+SEARCH = """
+from ciel import Application
+from ciel.core.module import Module, ModuleManifest, Requirement
+
+
+class Search:
+    pass
+
+
+class SearchModule(Module):
+    provides = ["search"]
+    routes = ["/search"]
+
+    def __init__(self) -> None:
+        super().__init__(ModuleManifest("search", (2, 1, 0), {Requirement("eager", "^1")}))
+
+    def register(self, app: Application) -> None:
+        app.singleton(Search, aliases=["search"])
+
+
+module = SearchModule
+"""
+
+
+class TestDiscovery(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.base = Path(directory.name)
+        self.modules = self.base / "modules"
+        self.index = self.base / ".ciel" / "modules.json"
+        for name, code in (("eager", EAGER), ("search", SEARCH)):
+            (self.modules / name).mkdir(parents=True)
+            (self.modules / name / "module.py").write_text(textwrap.dedent(code))
+        self.forget()
+        self.addCleanup(self.forget)
+
+    @staticmethod
+    def forget() -> None:
+        for name in ("ciel_modules.eager", "ciel_modules.search"):
+            sys.modules.pop(name, None)
+
+    def test_cold_start(self) -> None:
+        modules = {m.manifest.name: m for m in discover(self.modules, self.index)}
+
+        self.assertEqual(set(modules), {"eager", "search"})
+        self.assertNotIsInstance(modules["search"], LazyModule)
+        entry = json.loads(self.index.read_text())["modules"]["search"]
+        self.assertEqual(entry["manifest"], {"name": "search", "version": "2.1.0", "dependencies": [["eager", "^1"]]})
+        self.assertEqual(entry["routes"], ["/search"])
+
+    def test_warm_start(self) -> None:
+        discover(self.modules, self.index)
+        self.forget()
+
+        modules = {m.manifest.name: m for m in discover(self.modules, self.index)}
+
+        search = modules["search"]
+        assert isinstance(search, LazyModule)
+        self.assertEqual(search.manifest.version, (2, 1, 0))
+        self.assertEqual(search.manifest.dependencies, {Requirement("eager", "^1")})
+        self.assertEqual(search.provides, ["search"])
+        self.assertNotIn("ciel_modules.search", sys.modules)
+        # Without contracts or routes to load it on, a module is imported.
+        self.assertNotIsInstance(modules["eager"], LazyModule)
+
+    def test_import_name(self) -> None:
+        (self.modules / "search").rename(self.modules / "search_v2")
+        self.addCleanup(sys.modules.pop, "ciel_modules.search_v2", None)
+        cold = {m.manifest.name: m for m in discover(self.modules, self.index)}
+        self.forget()
+        sys.modules.pop("ciel_modules.search_v2")
+
+        search = {m.manifest.name: m for m in discover(self.modules, self.index)}["search"]
+        assert isinstance(search, LazyModule)
+        self.assertEqual(type(search.load()).__module__, type(cold["search"]).__module__)
+
+    def test_changed_module(self) -> None:
+        discover(self.modules, self.index)
+        path = self.modules / "search" / "module.py"
+        path.write_text(path.read_text().replace("(2, 1, 0)", "(2, 2, 0)"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        modules = {m.manifest.name: m for m in discover(self.modules, self.index)}
+
+        self.assertNotIsInstance(modules["search"], LazyModule)
+        self.assertEqual(modules["search"].manifest.version, (2, 2, 0))
+
+    def test_new_module(self) -> None:
+        discover(self.modules, self.index)
+        (self.modules / "other").mkdir()
+        (self.modules / "other" / "module.py").write_text(textwrap.dedent(EAGER).replace('"eager"', '"other"'))
+        self.addCleanup(sys.modules.pop, "ciel_modules.other", None)
+        stat = self.modules.stat()
+        os.utime(self.modules, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        names = {m.manifest.name for m in discover(self.modules, self.index)}
+        self.assertEqual(names, {"eager", "search", "other"})
+
+    def test_new_module_in_existing_directory(self) -> None:
+        (self.modules / "other").mkdir()
+        discover(self.modules, self.index)
+        stat = self.modules.stat()
+        (self.modules / "other" / "module.py").write_text(textwrap.dedent(EAGER).replace('"eager"', '"other"'))
+        self.addCleanup(sys.modules.pop, "ciel_modules.other", None)
+        self.assertEqual(self.modules.stat().st_mtime_ns, stat.st_mtime_ns)
+
+        names = {m.manifest.name for m in discover(self.modules, self.index)}
+        self.assertEqual(names, {"eager", "search", "other"})
+
+    def test_application(self) -> None:
+        Application(self.base, [])
+        self.forget()
+
+        app = Application(self.base, [])
+        self.assertNotIn("ciel_modules.search", sys.modules)
+        self.assertEqual(type(app.make("search")).__name__, "Search")
+        self.assertEqual([m.manifest.name for m in Application(self.base, [], discover_modules=False).modules], [])
@@ -0,0 +1,185 @@
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from ciel import Application
+from ciel.core.module import LazyModule, ModuleManifest
+from ciel.http import HttpModule, Response, Router
+from ...asgi import http_scope
+
+REPORTS = """
+from ciel import Application
+from ciel.core.module import Module, ModuleManifest
+from ciel.http import Response, Router
+
+
+class Reports:
+    pass
+
+
+class ReportsModule(Module):
+
+    def __init__(self) -> None:
+        super().__init__(ModuleManifest("reports"))
+        self.booted = 0
+
+    def register(self, app: Application) -> None:
+        app.singleton(Reports, aliases=["reports"])
+
+    def boot(self, router: Router) -> None:
+        self.booted += 1
+
+        @router.get("/reports/summary")
+        def summary(reports: Reports) -> Response:
+            response = Response()
+            response.body = type(reports).__name__.encode()
+            return response
+
+
+module = ReportsModule()
+"""
+
+SERVICE = """
+import asyncio
+
+from ciel import Application
+from ciel.core.module import Module, ModuleManifest
+
+
+class Service:
+    pass
+
+
+class ServiceModule(Module):
+
+    def __init__(self) -> None:
+        super().__init__(ModuleManifest("service"))
+        self.booted = 0
+
+    def register(self, app: Application) -> None:
+        app.singleton(Service, aliases=["service"])
+
+    async def boot(self, service: Service) -> None:
+        await asyncio.sleep(0)
+        if FAIL:
+            raise ConnectionError("service unreachable")
+        self.booted += 1
+
+
+FAIL = {fail}
+module = ServiceModule()
+"""
+
+
+class TestLazyModule(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "reports.py"
+        path.write_text(textwrap.dedent(REPORTS))
+        self.addCleanup(sys.modules.pop, "ciel_modules.reports", None)
+
+        http = HttpModule()
+        self.lazy = LazyModule(ModuleManifest("reports", dependencies={http.manifest}), path,
+                               provides=["reports"], routes=["/reports"])
+        self.app = Application(Path("."), [http, self.lazy])
+
+    def test_not_imported_up_front(self) -> None:
+        self.app.boot()
+        self.assertNotIn("ciel_modules.reports", sys.modules)
+        self.assertIsNone(self.lazy.loaded)
+
+    def test_loaded_on_resolution(self) -> None:
+        self.app.boot()
+        reports = self.app.make("reports")
+
+        self.assertEqual(type(reports).__name__, "Reports")
+        self.assertIsNotNone(self.lazy.loaded)
+        self.assertEqual(self.lazy.loaded.booted, 1)  # type: ignore
+        self.assertIn("reports", self.app.boot_timings)
+        self.assertIs(self.app.make("reports"), reports)
+
+    def test_loaded_before_boot(self) -> None:
+        self.app.make("reports")
+        self.assertEqual(self.lazy.loaded.booted, 0)  # type: ignore
+
+        self.app.boot()
+        self.assertEqual(self.lazy.loaded.booted, 1)  # type: ignore
+
+    async def test_loaded_on_route(self) -> None:
+        await self.app.startup()
+        send = AsyncMock()
+        await self.app(http_scope("/reports/summary"), AsyncMock(), send)
+
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 200)
+        self.assertEqual(send.call_args_list[1].args[0]["body"], b"Reports")
+        self.assertEqual(self.app.lazy_routes, [])
+
+        send = AsyncMock()
+        await self.app(http_scope("/other"), AsyncMock(), send)
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 404)
+
+    def test_frozen_container(self) -> None:
+        self.app.boot()
+        self.app.freeze()
+
+        with self.assertRaises(RuntimeError):
+            self.app.make("reports")
+        self.assertNotIn("ciel_modules.reports", sys.modules)
+
+
+class TestAsyncLazyModule(unittest.IsolatedAsyncioTestCase):
+
+    def lazy_service(self, fail: bool) -> tuple[Application, LazyModule]:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "service.py"
+        path.write_text(textwrap.dedent(SERVICE.format(fail=fail)))
+        self.addCleanup(sys.modules.pop, "ciel_modules.service", None)
+
+        lazy = LazyModule(ModuleManifest("service"), path, provides=["service"])
+        return Application(Path("."), [HttpModule(), lazy]), lazy
+
+    async def test_asynchronous_boot(self) -> None:
+        app, lazy = self.lazy_service(fail=False)
+        await app.startup()
+        service = await app.make_async("service")
+
+        self.assertEqual(type(service).__name__, "Service")
+        self.assertEqual(lazy.loaded.booted, 1)  # type: ignore
+        self.assertIs(await app.make_async("service"), service)
+
+    async def test_failed_boot(self) -> None:
+        app, lazy = self.lazy_service(fail=True)
+        await app.startup()
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                await app.make_async("service")
+            self.assertIsNone(lazy.loaded)
+            self.assertNotIn("service", app.aliases)
+            self.assertIn("service", app.lazy_contracts)
+
+    async def test_injected_into_endpoint(self) -> None:
+        app, lazy = self.lazy_service(fail=False)
+        router = app[Router]
+
+        @router.get("/service")
+        async def show(service: "service") -> Response:  # type: ignore # noqa: F821
+            response = Response()
+            response.body = type(service).__name__.encode()
+            return response
+
+        await app.startup()
+        self.assertFalse(app.is_bound("service"))
+        app.graph().validate()
+        self.assertIsNone(lazy.loaded)
+
+        send = AsyncMock()
+        await app(http_scope("/service"), AsyncMock(), send)
+        self.assertEqual(send.call_args_list[1].args[0]["body"], b"Service")
+        self.assertEqual(lazy.loaded.booted, 1)  # type: ignore
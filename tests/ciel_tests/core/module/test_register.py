@@ -79,6 +79,18 @@ class TestModuleRegister(unittest.TestCase):
         self.assertLess(modules_order.index(module_c), modules_order.index(module_h))
         self.assertLess(modules_order.index(module_d), modules_order.index(module_h))
 
+    def test_layers(self) -> None:
+        manifest_a = ModuleManifest("A")
+        manifest_b = ModuleManifest("B")
+        manifest_c = ModuleManifest("C", dependencies={manifest_a})
+        manifest_d = ModuleManifest("D", dependencies={manifest_b, manifest_c})
+        module_a, module_b, module_c, module_d = (Module(m) for m in (manifest_a, manifest_b, manifest_c, manifest_d))
+
+        register = ModuleRegister([module_d, module_c, module_b, module_a])
+
+        self.assertEqual([set(layer) for layer in register.layers], [{module_a, module_b}, {module_c}, {module_d}])
+        self.assertEqual(register.modules, [m for layer in register.layers for m in layer])
+
     def test_missing_dependency(self) -> None:
         manifest_a = ModuleManifest("A")
         manifest_b = ModuleManifest("B", dependencies={manifest_a})
@@ -98,3 +110,74 @@ class TestModuleRegister(unittest.TestCase):
 
         with self.assertRaises(RuntimeError):
             ModuleRegister([module_a, module_b])
+
+    def test_cycle_path(self) -> None:
+        manifest_a = ModuleManifest("A")
+        manifest_b = ModuleManifest("B", dependencies={manifest_a})
+        manifest_c = ModuleManifest("C")
+        manifest_d = ModuleManifest("D", dependencies={manifest_c})
+        manifest_a.dependencies = {manifest_d}
+        manifest_c.dependencies = {manifest_a}
+
+        with self.assertRaises(RuntimeError) as raised:
+            ModuleRegister([Module(m) for m in (manifest_b, manifest_a, manifest_c, manifest_d)])
+
+        path = str(raised.exception).split(": ")[1].split(" -> ")
+        self.assertEqual(path[0], path[-1])
+        self.assertEqual(sorted(path[:-1]), ["A", "C", "D"])
+
+    def test_cycle_next_to_independent_module(self) -> None:
+        manifest_a = ModuleManifest("A")
+        manifest_b = ModuleManifest("B", dependencies={manifest_a})
+        manifest_a.dependencies = {manifest_b}
+
+        for _ in range(20):
+            with self.assertRaises(RuntimeError) as raised:
+                ModuleRegister([Module(ModuleManifest("X")), Module(manifest_a), Module(manifest_b)])
+            self.assertIn(str(raised.exception).split(": ")[1], ["A -> B -> A", "B -> A -> B"])
+
+    def test_add_sorted(self) -> None:
+        manifest_a = ModuleManifest("A")
+        manifest_b = ModuleManifest("B", dependencies={manifest_a})
+        module_a, module_b = Module(manifest_a), Module(manifest_b)
+
+        register = ModuleRegister([])
+        with self.assertRaises(ValueError):
+            register.add_sorted([module_b, module_a])
+        self.assertEqual(register.depth, {})
+
+        register.add_sorted([module_a, module_b])
+        self.assertEqual(register.layers, [[module_a], [module_b]])
+
+    def test_add(self) -> None:
+        manifest_a = ModuleManifest("A")
+        manifest_b = ModuleManifest("B", dependencies={manifest_a})
+        manifest_c = ModuleManifest("C", dependencies={manifest_b})
+        module_a, module_b, module_c = Module(manifest_a), Module(manifest_b), Module(manifest_c)
+        register = ModuleRegister([module_a])
+
+        register.add(module_c, module_b)
+
+        self.assertEqual(register.modules, [module_a, module_b, module_c])
+        self.assertEqual(register.layers, [[module_a], [module_b], [module_c]])
+        with self.assertRaises(ValueError):
+            register.add(module_b)
+        with self.assertRaises(ValueError):
+            register.add(Module(ModuleManifest("D", dependencies={ModuleManifest("E")})))
+
+    def test_remove(self) -> None:
+        manifest_a = ModuleManifest("A")
+        manifest_b = ModuleManifest("B", dependencies={manifest_a})
+        module_a, module_b = Module(manifest_a), Module(manifest_b)
+        register = ModuleRegister([module_a, module_b])
+
+        with self.assertRaises(ValueError):
+            register.remove(module_a)
+
+        register.remove(module_b)
+        self.assertEqual(register.modules, [module_a])
+        self.assertEqual(register.layers, [[module_a]])
+
+        register.remove(module_a)
+        self.assertEqual(register.modules, [])
+        self.assertEqual(register.layers, [])
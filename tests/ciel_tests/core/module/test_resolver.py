@@ -0,0 +1,60 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ciel.core.module import Module, ModuleManifest, ModuleRegister, Requirement, resolve
+
+
+class TestResolver(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.db_1 = Module(ModuleManifest("db", (1, 4, 0)))
+        self.db_2 = Module(ModuleManifest("db", (2, 1, 0)))
+        self.cache_1 = Module(ModuleManifest("cache", (1, 0, 0), {Requirement("db", "^1.2")}))
+        self.web = Module(ModuleManifest("web", (3, 0, 0), {Requirement("db", ">=1"), Requirement("cache", "*")}))
+
+    def test_highest_compatible_versions(self) -> None:
+        api = Module(ModuleManifest("api", (1, 0, 0), {Requirement("db", ">=1")}))
+        self.assertEqual(resolve([self.db_1, self.db_2, api]), [self.db_2, api])
+        self.assertEqual(set(resolve([self.db_2, self.db_1, self.cache_1, self.web])),
+                         {self.db_1, self.cache_1, self.web})
+
+    def test_no_compatible_versions(self) -> None:
+        cache_2 = Module(ModuleManifest("cache", (2, 0, 0), {Requirement("db", "^3")}))
+        with self.assertRaises(ValueError):
+            resolve([self.db_1, self.db_2, cache_2])
+
+    def test_missing(self) -> None:
+        with self.assertRaises(ValueError):
+            resolve([self.cache_1])
+        with self.assertRaises(ValueError):
+            ModuleRegister([self.db_2, self.cache_1])
+
+    def test_register(self) -> None:
+        register = ModuleRegister([self.web, self.cache_1, self.db_2, self.db_1])
+        self.assertEqual(register.layers, [[self.db_1], [self.cache_1], [self.web]])
+
+    def test_cache(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / ".ciel" / "resolution.json"
+        modules = [self.web, self.cache_1, self.db_2, self.db_1]
+
+        first = ModuleRegister(modules, cache=path)
+        self.assertEqual(json.loads(path.read_text())["modules"], [["db", "1.4.0"], ["cache", "1.0.0"], ["web", "3.0.0"]])
+
+        with patch("ciel.core.module.register.resolve") as resolver, \
+                patch.object(ModuleRegister, "add", autospec=True) as add:
+            second = ModuleRegister(modules, cache=path)
+        resolver.assert_not_called()
+        add.assert_not_called()
+        self.assertEqual(second.modules, first.modules)
+        self.assertEqual(second.layers, first.layers)
+
+        # Any change to the manifests invalidates the cache.
+        db_3 = Module(ModuleManifest("db", (1, 5, 0)))
+        third = ModuleRegister(modules + [db_3], cache=path)
+        self.assertIn(db_3, third.modules)
+        self.assertEqual(json.loads(path.read_text())["modules"][0], ["db", "1.5.0"])
@@ -0,0 +1,43 @@
+import unittest
+
+from ciel.core.module import Requirement, parse_version
+
+
+class TestVersion(unittest.TestCase):
+
+    def test_parse_version(self) -> None:
+        self.assertEqual(parse_version("1.2.3"), (1, 2, 3))
+        self.assertEqual(parse_version("v2"), (2, 0, 0))
+        for invalid in ("", "1.2.3.4", "1.x", "-1"):
+            with self.subTest(invalid=invalid), self.assertRaises(ValueError):
+                parse_version(invalid)
+
+    def test_ranges(self) -> None:
+        cases = {
+            "^1.2.3": ([(1, 2, 3), (1, 9, 0)], [(1, 2, 2), (2, 0, 0)]),
+            "^0.2.3": ([(0, 2, 3), (0, 2, 9)], [(0, 3, 0)]),
+            "^0.0.3": ([(0, 0, 3)], [(0, 0, 4)]),
+            "~1.2.3": ([(1, 2, 3), (1, 2, 9)], [(1, 3, 0)]),
+            "~1": ([(1, 0, 0), (1, 9, 9)], [(2, 0, 0)]),
+            "1.2": ([(1, 2, 0), (1, 2, 9)], [(1, 3, 0), (1, 1, 9)]),
+            "1.2.3": ([(1, 2, 3)], [(1, 2, 4)]),
+            ">=1.0, <1.5, !=1.2.0": ([(1, 0, 0), (1, 4, 9)], [(1, 2, 0), (1, 5, 0), (0, 9, 0)]),
+            "*": ([(0, 0, 0), (9, 9, 9)], []),
+        }
+        for spec, (matching, other) in cases.items():
+            requirement = Requirement("db", spec)
+            for version in matching:
+                with self.subTest(spec=spec, version=version):
+                    self.assertTrue(requirement.matches(version))
+            for version in other:
+                with self.subTest(spec=spec, version=version):
+                    self.assertFalse(requirement.matches(version))
+
+    def test_invalid(self) -> None:
+        for spec in ("", "^", ">=*", "1.2.3.4", "latest"):
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                Requirement("db", spec)
+
+    def test_equality(self) -> None:
+        self.assertEqual(Requirement("db", "~1.2.3"), Requirement("db", ">=1.2.3,<1.3.0"))
+        self.assertEqual(len({Requirement("db", "^1"), Requirement("db", "^1.0.0")}), 1)
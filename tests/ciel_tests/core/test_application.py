@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from ciel import Application
+from ciel.core.module import Module, ModuleManifest
+from ..asgi import http_scope
+
+
+class Service:
+    pass
+
+
+class ServiceModule(Module):
+
+    def __init__(self) -> None:
+        super().__init__(ModuleManifest("service"))
+        self.booted = 0
+
+    def register(self, app: Application) -> None:
+        app.singleton(Service)
+
+    def boot(self, service: Service) -> None:
+        self.booted += 1
+
+
+class FailingModule(Module):
+
+    def __init__(self) -> None:
+        super().__init__(ModuleManifest("failing"))
+
+    def boot(self) -> None:
+        raise ConnectionError("database unreachable")
+
+
+class AsyncModule(Module):
+
+    def __init__(self, name: str, events: list[str], *dependencies: ModuleManifest) -> None:
+        super().__init__(ModuleManifest(name, dependencies=set(dependencies)))
+        self.events: list[str] = events
+
+    async def boot(self) -> None:
+        self.events.append(f"boot {self.manifest.name}")
+        await asyncio.sleep(0.01)
+        self.events.append(f"booted {self.manifest.name}")
+
+    async def shutdown(self) -> None:
+        self.events.append(f"shutdown {self.manifest.name}")
+
+
+class BlockingModule(Module):
+    threaded = True
+
+    def __init__(self, name: str, threads: set[int]) -> None:
+        super().__init__(ModuleManifest(name))
+        self.threads: set[int] = threads
+
+    def boot(self) -> None:
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+
+
+class TestApplication(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.module = ServiceModule()
+        self.app = Application(Path("."), [self.module])
+
+    async def test_lifespan(self) -> None:
+        receive = AsyncMock(side_effect=[{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        send = AsyncMock()
+
+        await self.app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive, send)
+
+        self.assertEqual(self.module.booted, 1)
+        self.assertTrue(self.app.booted)
+        self.assertEqual([call.args[0]["type"] for call in send.call_args_list],
+                         ["lifespan.startup.complete", "lifespan.shutdown.complete"])
+
+    async def test_lifespan_startup_failed(self) -> None:
+        app = Application(Path("."), [FailingModule()])
+        receive = AsyncMock(side_effect=[{"type": "lifespan.startup"}])
+        send = AsyncMock()
+
+        await app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive, send)
+
+        event = send.call_args.args[0]
+        self.assertEqual(event["type"], "lifespan.startup.failed")
+        self.assertIn("database unreachable", event["message"])
+
+    async def test_boot_on_first_request(self) -> None:
+        send = AsyncMock()
+        await self.app(http_scope(), AsyncMock(), send)
+        await self.app(http_scope(), AsyncMock(), send)
+
+        self.assertEqual(self.module.booted, 1)
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 404)
+
+    async def test_handle(self) -> None:
+        handler = AsyncMock()
+        self.app.handle("http", handler)
+        scope = http_scope()
+
+        await self.app(scope, AsyncMock(), AsyncMock())
+        handler.assert_awaited_once()
+        self.assertIs(handler.call_args.args[0], scope)
+
+        with self.assertRaises(RuntimeError):
+            self.app.handle("http", handler)
+
+    async def test_websocket_rejected_by_default(self) -> None:
+        send = AsyncMock()
+        scope = http_scope()
+        scope["type"] = "websocket"
+
+        await self.app(scope, AsyncMock(), send)
+        self.assertEqual(send.call_args.args[0]["type"], "websocket.close")
+
+    async def test_unknown_scope(self) -> None:
+        self.app.boot()
+        with self.assertRaises(ValueError):
+            await self.app({"type": "unknown"}, AsyncMock(), AsyncMock())
+
+    async def test_middleware(self) -> None:
+        calls = []
+
+        def tagging(tag: str):
+            def factory(app):
+                async def middleware(scope, receive, send):
+                    calls.append(tag)
+                    await app(scope, receive, send)
+                return middleware
+            return factory
+
+        self.app.middleware(tagging("outer"))
+        self.app.middleware(tagging("inner"))
+        send = AsyncMock()
+        await self.app(http_scope(), AsyncMock(), send)
+        await self.app(http_scope(), AsyncMock(), send)
+
+        self.assertEqual(calls, ["outer", "inner", "outer", "inner"])
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 404)
+        with self.assertRaises(RuntimeError):
+            self.app.middleware(tagging("late"))
+
+
+class TestAsyncBoot(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.events: list[str] = []
+        self.database = AsyncModule("database", self.events)
+        self.cache = AsyncModule("cache", self.events)
+        self.web = AsyncModule("web", self.events, self.database.manifest, self.cache.manifest)
+        self.app = Application(Path("."), [self.web, self.database, self.cache])
+
+    async def test_independent_modules_boot_concurrently(self) -> None:
+        await self.app.startup()
+
+        self.assertTrue(self.app.booted)
+        self.assertEqual(sorted(self.events[:2]), ["boot cache", "boot database"])
+        self.assertEqual(sorted(self.events[2:4]), ["booted cache", "booted database"])
+        self.assertEqual(self.events[4:], ["boot web", "booted web"])
+
+    async def test_boot_timings(self) -> None:
+        await self.app.startup()
+
+        self.assertEqual(set(self.app.boot_timings), {"database", "cache", "web"})
+        self.assertGreaterEqual(self.app.boot_timings["web"], 0.01)
+
+    async def test_blocking_modules_boot_in_threads(self) -> None:
+        threads: set[int] = set()
+        app = Application(Path("."), [BlockingModule("a", threads), BlockingModule("b", threads)])
+        await app.startup()
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_blocking_modules_boot_in_loop_by_default(self) -> None:
+        threads: set[int] = set()
+
+        class Inline(BlockingModule):
+            threaded = False
+
+        app = Application(Path("."), [Inline("a", threads), Inline("b", threads)])
+        await app.startup()
+
+        self.assertEqual(threads, {threading.get_ident()})
+
+    async def test_concurrent_startup(self) -> None:
+        await asyncio.gather(self.app.startup(), self.app.startup())
+        self.assertEqual(self.events.count("boot web"), 1)
+
+    async def test_shutdown_after_dependents(self) -> None:
+        await self.app.startup()
+        self.events.clear()
+        await self.app.shutdown()
+
+        self.assertEqual(self.events[0], "shutdown web")
+        self.assertEqual(sorted(self.events[1:]), ["shutdown cache", "shutdown database"])
+
+    async def test_lifespan_shutdown_failed(self) -> None:
+        async def shutdown() -> None:
+            raise ConnectionError("flush failed")
+
+        self.cache.shutdown = shutdown  # type: ignore
+        receive = AsyncMock(side_effect=[{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        send = AsyncMock()
+
+        await self.app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive, send)
+
+        self.assertEqual(send.call_args_list[0].args[0]["type"], "lifespan.startup.complete")
+        self.assertEqual(send.call_args_list[1].args[0]["type"], "lifespan.shutdown.failed")
+        self.assertIn("flush failed", send.call_args_list[1].args[0]["message"])
+
+    async def test_sync_boot_inside_loop(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.app.boot()
+
+
+class TestSyncBootOfAsyncModules(unittest.TestCase):
+
+    def test_boot_runs_loop(self) -> None:
+        events: list[str] = []
+        app = Application(Path("."), [AsyncModule("database", events)])
+        app.boot()
+
+        self.assertTrue(app.booted)
+        self.assertEqual(events, ["boot database", "booted database"])
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ciel import Application
+from ciel.core.module import Module, ModuleManifest
+from ciel.core.util import tracing
+
+
+class Service:
+    pass
+
+
+class ServiceModule(Module):
+
+    def __init__(self) -> None:
+        super().__init__(ModuleManifest("service"))
+
+    def register(self, app: Application) -> None:
+        app.singleton(Service)
+
+    async def boot(self, service: Service) -> None:
+        await asyncio.sleep(0)
+
+
+class TestTracer(unittest.TestCase):
+
+    def test_span(self) -> None:
+        tracer = tracing.Tracer(Path("trace.json"))
+        try:
+            with tracer.span("build", "binding"):
+                data = [bytes(1024) for _ in range(100)]
+        finally:
+            if tracer.owns_tracemalloc:
+                tracemalloc.stop()
+
+        [span] = tracer.spans
+        self.assertEqual(("build", "binding"), (span.name, span.category))
+        self.assertGreater(span.duration, 0)
+        self.assertGreaterEqual(span.memory, 100 * 1024)
+        del data
+
+        [event] = tracer.chrome_trace()["traceEvents"]
+        self.assertEqual("X", event["ph"])
+        self.assertEqual({"memory": span.memory}, event["args"])
+        self.assertIn("binding: 1 spans", tracer.summary())
+
+    def test_disabled(self) -> None:
+        with patch.dict(os.environ, {tracing.ENV_VAR: ""}):
+            app = Application(Path(), [ServiceModule()])
+        self.assertIsNone(app.tracer)
+        self.assertIs(tracing.NULL_SPAN, tracing.span("resolve", "modules"))
+
+    def test_startup(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+            with patch.dict(os.environ, {tracing.ENV_VAR: str(path)}):
+                app = Application(Path(directory), [ServiceModule()])
+                self.assertIsNotNone(app.tracer)
+                app.boot()
+
+            self.assertIsNone(app.tracer)
+            self.assertIsNone(tracing.current)
+            events = json.loads(path.read_text())["traceEvents"]
+            spans = {(event["cat"], event["name"]) for event in events}
+            self.assertLessEqual({
+                ("modules", "resolve"),
+                ("register", "service"),
+                ("binding", f"{Service.__module__}.{Service.__qualname__}"),
+                ("boot", "service"),
+            }, spans)
+            self.assertIn("boot: 1 spans", path.with_suffix(".txt").read_text())
+
+    def test_default_path(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.dict(os.environ, {tracing.ENV_VAR: "1"}):
+                app = Application(Path(directory), [])
+            app.boot()
+            self.assertTrue((Path(directory) / ".ciel" / "startup-trace.json").exists())
+
+    def test_failed_init(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+            with patch.dict(os.environ, {tracing.ENV_VAR: str(path)}):
+                with self.assertRaises(ValueError):
+                    Application(Path(directory), [Module(ModuleManifest("web", dependencies={ModuleManifest("db")}))])
+
+            self.assertIsNone(tracing.current)
+            self.assertTrue(path.exists())
+
+    def test_finish_without_boot(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "trace.json"
+            with patch.dict(os.environ, {tracing.ENV_VAR: str(path)}):
+                app = Application(Path(directory), [ServiceModule()])
+            app.finish_trace()
+
+            self.assertIsNone(tracing.current)
+            self.assertIn("register: 1 spans", path.with_suffix(".txt").read_text())
@@ -1 +1,7 @@
 from . import test_http_objects
+from . import test_kernel
+from . import test_routing
+from . import test_responses
+from . import test_headers
+from . import test_json
+from . import test_forms
@@ -0,0 +1,131 @@
+import unittest
+from unittest.mock import AsyncMock
+
+from ciel.http import FormLimits, HttpError, Request, UploadFile
+from ciel.http.forms import parse_options
+from ..asgi import http_scope
+
+BOUNDARY = "----ciel"
+
+MULTIPART = (
+    b"preamble\r\n"
+    b"------ciel\r\n"
+    b'Content-Disposition: form-data; name="title"\r\n'
+    b"\r\n"
+    b"Hello\r\nWorld\r\n"
+    b"------ciel\r\n"
+    b'Content-Disposition: form-data; name="upload"; filename="r\xc3\xa9sum\xc3\xa9.txt"\r\n'
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"file contents\r\n"
+    b"------ciel--\r\n"
+)
+
+
+def form_request(body: bytes, content_type: str, chunk_size: int = 7) -> Request:
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    scope = http_scope()
+    scope["headers"] = [(b"content-type", content_type.encode())]
+    receive = AsyncMock(side_effect=[
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1} for i, chunk in enumerate(chunks)
+    ])
+    return Request(scope, receive)
+
+
+class TestParseOptions(unittest.TestCase):
+
+    def test_quoted(self) -> None:
+        self.assertEqual(parse_options('form-data; name="a;b"; filename="x\\"y.txt"'),
+                         ("form-data", {"name": "a;b", "filename": 'x"y.txt'}))
+
+    def test_token(self) -> None:
+        self.assertEqual(parse_options("multipart/form-data; boundary=abc"), ("multipart/form-data", {"boundary": "abc"}))
+
+
+class TestUrlencoded(unittest.IsolatedAsyncioTestCase):
+
+    async def test_parse(self) -> None:
+        request = form_request(b"name=Jane+Doe&tag=a&tag=b%26c&empty=&flag", "application/x-www-form-urlencoded")
+        form = await request.form()
+
+        self.assertEqual(form["name"], "Jane Doe")
+        self.assertEqual(form.get_all("tag"), ["a", "b&c"])
+        self.assertEqual(form["empty"], "")
+        self.assertEqual(form["flag"], "")
+        self.assertIs(await request.form(), form)
+
+    async def test_too_many_fields(self) -> None:
+        request = form_request(b"a=1&b=2&c=3", "application/x-www-form-urlencoded")
+        with self.assertRaises(HttpError) as raised:
+            await request.form(FormLimits(max_fields=2))
+        self.assertEqual(raised.exception.status, 413)
+
+    async def test_field_too_large(self) -> None:
+        request = form_request(b"a=" + b"x" * 100, "application/x-www-form-urlencoded")
+        with self.assertRaises(HttpError) as raised:
+            await request.form(FormLimits(max_field_size=10))
+        self.assertEqual(raised.exception.status, 413)
+
+
+class TestMultipart(unittest.IsolatedAsyncioTestCase):
+
+    async def test_parse(self) -> None:
+        for chunk_size in (1, 7, len(MULTIPART)):
+            with self.subTest(chunk_size=chunk_size):
+                form = await form_request(MULTIPART, f"multipart/form-data; boundary={BOUNDARY}", chunk_size).form()
+                self.assertEqual(form["title"], "Hello\r\nWorld")
+
+                upload = form["upload"]
+                assert isinstance(upload, UploadFile)
+                self.assertEqual(upload.filename, "résumé.txt")
+                self.assertEqual(upload.content_type, "text/plain")
+                self.assertEqual(await upload.read(), b"file contents")
+                await form.close()
+
+    async def test_spooled_to_disk(self) -> None:
+        body = MULTIPART.replace(b"file contents", b"x" * 1000)
+        form = await form_request(body, f"multipart/form-data; boundary={BOUNDARY}", 64).form(FormLimits(spool_size=100))
+
+        upload = form["upload"]
+        assert isinstance(upload, UploadFile)
+        self.assertFalse(upload.in_memory)
+        self.assertTrue(upload.file._rolled)  # type: ignore
+        self.assertEqual(await upload.read(), b"x" * 1000)
+        await form.close()
+
+    async def test_file_too_large(self) -> None:
+        request = form_request(MULTIPART, f"multipart/form-data; boundary={BOUNDARY}")
+        with self.assertRaises(HttpError) as raised:
+            await request.form(FormLimits(max_file_size=5))
+        self.assertEqual(raised.exception.status, 413)
+
+    async def test_too_many_files(self) -> None:
+        request = form_request(MULTIPART, f"multipart/form-data; boundary={BOUNDARY}")
+        with self.assertRaises(HttpError) as raised:
+            await request.form(FormLimits(max_files=0))
+        self.assertEqual(raised.exception.status, 413)
+
+    async def test_truncated(self) -> None:
+        request = form_request(MULTIPART[:-10], f"multipart/form-data; boundary={BOUNDARY}")
+        with self.assertRaises(HttpError) as raised:
+            await request.form()
+        self.assertEqual(raised.exception.status, 400)
+
+    async def test_missing_boundary(self) -> None:
+        with self.assertRaises(HttpError) as raised:
+            await form_request(MULTIPART, "multipart/form-data").form()
+        self.assertEqual(raised.exception.status, 400)
+
+    async def test_unsupported_type(self) -> None:
+        with self.assertRaises(HttpError) as raised:
+            await form_request(b"{}", "application/json").form()
+        self.assertEqual(raised.exception.status, 415)
+
+    async def test_unsupported_charset(self) -> None:
+        for charset in ("bogus", "base64"):
+            with self.assertRaises(HttpError) as raised:
+                await form_request(b"a=1", f"application/x-www-form-urlencoded; charset={charset}").form()
+            self.assertEqual(raised.exception.status, 415)
+
+        form = await form_request(b"a=caf\xe9", "application/x-www-form-urlencoded; charset=latin-1").form()
+        self.assertEqual(form["a"], "café")
@@ -0,0 +1,104 @@
+import unittest
+
+from ciel.http import Headers, HeaderTemplate
+
+
+class TestHeaders(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.raw = [
+            (b"content-type", b"application/json"),
+            (b"accept", b"text/html"),
+            (b"accept", b"application/json"),
+            (b"x-name", b"caf\xe9"),
+        ]
+        self.headers = Headers(self.raw, readonly=True)
+
+    def test_getitem(self) -> None:
+        self.assertEqual(self.headers["Content-Type"], "application/json")
+        self.assertEqual(self.headers[b"accept"], "text/html")
+        self.assertEqual(self.headers["x-name"], "café")
+        with self.assertRaises(KeyError):
+            self.headers["missing"]
+
+    def test_get(self) -> None:
+        self.assertEqual(self.headers.get("ACCEPT"), "text/html")
+        self.assertIsNone(self.headers.get("missing"))
+        self.assertEqual(self.headers.get("missing", "default"), "default")
+        self.assertEqual(self.headers.get_raw("content-type"), b"application/json")
+
+    def test_get_all(self) -> None:
+        self.assertEqual(self.headers.get_all("accept"), ["text/html", "application/json"])
+        self.assertEqual(self.headers.get_all_raw("accept"), [b"text/html", b"application/json"])
+        self.assertEqual(self.headers.get_all("missing"), [])
+
+    def test_contains(self) -> None:
+        self.assertIn("Accept", self.headers)
+        self.assertNotIn("missing", self.headers)
+
+    def test_readonly(self) -> None:
+        with self.assertRaises(ValueError):
+            self.headers["x-other"] = "value"
+        with self.assertRaises(ValueError):
+            del self.headers["accept"]
+
+    def test_setitem(self) -> None:
+        headers = Headers()
+        headers["Set-Cookie"] = "a=1"
+        headers["set-cookie"] = "b=2"
+        headers["Content-Type"] = "text/plain"
+        self.assertEqual(headers.get_all("set-cookie"), ["a=1", "b=2"])
+
+        headers["set-cookie"] = ["c=3"]
+        self.assertEqual(headers.to_headers(), [(b"content-type", b"text/plain"), (b"set-cookie", b"c=3")])
+
+        del headers["set-cookie"]
+        self.assertEqual(len(headers), 1)
+
+    def test_to_headers_is_not_reencoded(self) -> None:
+        self.assertIs(self.headers.to_headers(), self.raw)
+        self.assertEqual(list(self.headers), self.raw)
+
+
+class TestHeaderTemplate(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.template = HeaderTemplate({
+            "Content-Type": "text/html; charset=utf-8",
+            "Server": "ciel",
+            "X-Frame-Options": "DENY",
+        })
+
+    def test_encoded_once(self) -> None:
+        self.assertEqual(self.template.raw, (
+            (b"content-type", b"text/html; charset=utf-8"),
+            (b"server", b"ciel"),
+            (b"x-frame-options", b"DENY"),
+        ))
+
+    def test_merge_without_own_headers(self) -> None:
+        self.assertIs(self.template.merge(Headers()), self.template.raw)
+
+    def test_merge(self) -> None:
+        headers = Headers()
+        headers["X-Request-Id"] = "42"
+        self.assertEqual(list(self.template.merge(headers)), [*self.template.raw, (b"x-request-id", b"42")])
+
+    def test_merge_replaces_same_name(self) -> None:
+        headers = Headers()
+        headers["Content-Type"] = "application/json"
+        self.assertEqual(list(self.template.merge(headers)), [
+            (b"server", b"ciel"),
+            (b"x-frame-options", b"DENY"),
+            (b"content-type", b"application/json"),
+        ])
+
+    def test_extend(self) -> None:
+        template = self.template.extend([("server", "other"), ("cache-control", "no-store")])
+        self.assertEqual(template.raw, (
+            (b"content-type", b"text/html; charset=utf-8"),
+            (b"x-frame-options", b"DENY"),
+            (b"server", b"other"),
+            (b"cache-control", b"no-store"),
+        ))
+        self.assertEqual(len(self.template.raw), 3)
@@ -1,8 +1,9 @@
 import unittest
 from unittest.mock import AsyncMock
 
-from ciel.http import Request, Response
+from ciel.http import ClientDisconnect, Request, Response, PayloadTooLarge, HeaderTemplate
 from ciel.http.http_objects import HttpData
+from ..asgi import http_scope
 
 
 class TestHttpData(unittest.TestCase):
@@ -13,6 +14,40 @@ class TestHttpData(unittest.TestCase):
         self.assertEqual(http_data["key1"], "value1")
         self.assertEqual(http_data["key2"], "value2")
 
+    def test_from_empty_query_string(self):
+        http_data = HttpData.from_query_string(b"")
+        self.assertNotIn("", http_data)
+        self.assertEqual(HttpData.from_query_string(b"a=1&&b=2&").data, {"a": ("1",), "b": ("2",)})
+
+    def test_from_escaped_query_string(self):
+        http_data = HttpData.from_query_string(b"q=caf%C3%A9+au+lait&a%26b=1%2B1&flag&q=2")
+        self.assertEqual(http_data.get_all("q"), ["café au lait", "2"])
+        self.assertEqual(http_data["a&b"], "1+1")
+        self.assertIsNone(http_data["flag"])
+        self.assertIn("flag", http_data)
+
+    def test_query_string_memoised(self):
+        data = b"page=2&sort=name"
+        self.assertIs(HttpData.from_query_string(data), HttpData.from_query_string(bytes(data)))
+
+        writable = HttpData.from_query_string(data, readonly=False)
+        self.assertIsNot(writable, HttpData.from_query_string(data, readonly=False))
+        writable["page"] = ["3"]
+        self.assertEqual(HttpData.from_query_string(data)["page"], "2")
+
+    def test_memoised_query_string_immutable(self):
+        http_data = HttpData.from_query_string(b"tag=a&tag=b")
+        with self.assertRaises(TypeError):
+            http_data.data["tag"] = ["c"]  # type: ignore
+        with self.assertRaises(AttributeError):
+            http_data.data["tag"].append("c")  # type: ignore
+        with self.assertRaises(ValueError):
+            http_data["tag"] = "c"
+
+        tags = http_data.get_all("tag")
+        tags.append("c")
+        self.assertEqual(HttpData.from_query_string(b"tag=a&tag=b").get_all("tag"), ["a", "b"])
+
     def test_from_headers(self):
         headers = [(b"Content-Type", b"application/json")]
         http_data = HttpData.from_headers(headers)
@@ -86,6 +121,84 @@ class TestRequest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(request.extensions, {"ext1": {"key": "value"}})
         self.assertEqual(request.body, b"Hello, World!")
 
+    def test_lazy_parsing(self) -> None:
+        scope = {
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "https",
+            "path": "/test",
+            "query_string": b"key=value",
+            "headers": [(b"x-token", b"secret")],
+            "client": None,
+            "server": None,
+            "extensions": None,
+        }
+        request = Request(scope)
+        self.assertNotIn("headers", vars(request))
+        self.assertNotIn("query_data", vars(request))
+
+        self.assertEqual(request.headers["X-Token"], "secret")
+        self.assertEqual(request.query_data["key"], "value")
+        self.assertIs(request.headers, request.headers)
+        self.assertIs(request.query_data, request.query_data)
+
+
+class TestRequestBody(unittest.IsolatedAsyncioTestCase):
+
+    def scope(self, headers: list[tuple[bytes, bytes]]) -> dict:
+        return http_scope("/upload", "POST", headers=headers)
+
+    def receive(self, *chunks: bytes) -> AsyncMock:
+        return AsyncMock(side_effect=[
+            {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+            for i, chunk in enumerate(chunks)
+        ])
+
+    async def test_stream(self) -> None:
+        request = Request(self.scope([]), self.receive(b"a", b"", b"bc"))
+        chunks = [chunk async for chunk in request.stream()]
+
+        self.assertEqual(chunks, [b"a", b"bc"])
+        self.assertEqual(request.body, b"")
+        with self.assertRaises(RuntimeError):
+            await request.read()
+
+    async def test_read(self) -> None:
+        request = Request(self.scope([]), self.receive(b"Hello, ", b"World!"))
+
+        self.assertEqual(await request.read(), b"Hello, World!")
+        self.assertEqual(await request.read(), b"Hello, World!")
+        self.assertEqual([chunk async for chunk in request.stream()], [b"Hello, World!"])
+
+    async def test_disconnect(self) -> None:
+        receive = AsyncMock(side_effect=[
+            {"type": "http.request", "body": b"partial", "more_body": True},
+            {"type": "http.disconnect"},
+        ])
+        request = Request(self.scope([]), receive)
+        with self.assertRaises(ClientDisconnect):
+            await request.read()
+        self.assertFalse(request.body_loaded)
+
+    async def test_max_body_size(self) -> None:
+        request = Request(self.scope([]), self.receive(b"12345", b"67890"), max_body_size=8)
+
+        chunks = []
+        with self.assertRaises(PayloadTooLarge):
+            async for chunk in request.stream():
+                chunks.append(chunk)
+        self.assertEqual(chunks, [b"12345"])
+
+    async def test_max_body_size_content_length(self) -> None:
+        receive = self.receive(b"12345")
+        request = Request(self.scope([(b"content-length", b"100")]), receive, max_body_size=8)
+
+        with self.assertRaises(PayloadTooLarge) as context:
+            await request.read()
+        self.assertEqual(context.exception.status, 413)
+        receive.assert_not_awaited()
+
 
 class TestResponse(unittest.IsolatedAsyncioTestCase):
 
@@ -101,11 +214,25 @@ class TestResponse(unittest.IsolatedAsyncioTestCase):
         send_mock.assert_any_call({
             "type": "http.response.start",
             "status": 200,
-            "headers": [(b"content-type", b"text%2Fplain")],
+            "headers": [(b"content-type", b"text/plain")],
             "trailers": False,
         })
         send_mock.assert_any_call({
             "type": "http.response.body",
             "body": b"Hello, World!",
             "more_body": False,
-        })
\ No newline at end of file
+        })
+
+    async def test_send_with_template(self) -> None:
+        template = HeaderTemplate({"content-type": "text/plain", "server": "ciel"})
+        response = Response(template)
+        response.headers["x-request-id"] = "42"
+
+        send_mock = AsyncMock()
+        await response.send(send_mock)
+
+        self.assertEqual(list(send_mock.call_args_list[0].args[0]["headers"]), [
+            (b"content-type", b"text/plain"),
+            (b"server", b"ciel"),
+            (b"x-request-id", b"42"),
+        ])
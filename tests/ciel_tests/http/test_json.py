@@ -0,0 +1,83 @@
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from ciel import Application
+from ciel.http import HttpError, HttpKernel, HttpModule, JSONResponse, JsonBackend, Request
+from ciel.http.json import OrjsonBackend, orjson
+from ..asgi import http_scope
+
+
+def receiving(*chunks: bytes) -> AsyncMock:
+    return AsyncMock(side_effect=[
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1} for i, chunk in enumerate(chunks)
+    ])
+
+
+class TestJsonBackend(unittest.TestCase):
+
+    def test_round_trip(self) -> None:
+        backend = JsonBackend()
+        data = backend.dumps({"name": "Élise", "tags": [1, 2]})
+        self.assertEqual(data, '{"name":"Élise","tags":[1,2]}'.encode())
+        self.assertEqual(backend.loads(data), {"name": "Élise", "tags": [1, 2]})
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson(self) -> None:
+        backend = OrjsonBackend()
+        self.assertEqual(backend.loads(backend.dumps({"a": [1, None]})), {"a": [1, None]})
+        with self.assertRaises(ValueError):
+            backend.loads(b"{")
+
+
+class TestRequestJson(unittest.IsolatedAsyncioTestCase):
+
+    async def test_decoded_once(self) -> None:
+        backend = JsonBackend()
+        request = Request(http_scope(), receiving(b'{"a": ', b"[1, 2]}"), json_backend=backend)
+
+        data = await request.json()
+        self.assertEqual(data, {"a": [1, 2]})
+        self.assertIs(await request.json(), data)
+
+    async def test_invalid(self) -> None:
+        request = Request(http_scope(), receiving(b"{"))
+
+        with self.assertRaises(HttpError) as raised:
+            await request.json()
+        self.assertEqual(raised.exception.status, 400)
+
+
+class TestJSONResponse(unittest.IsolatedAsyncioTestCase):
+
+    async def test_send(self) -> None:
+        send = AsyncMock()
+        await JSONResponse({"ok": True}, status=201, backend=JsonBackend()).send(send)
+
+        start, body = (call.args[0] for call in send.call_args_list)
+        self.assertEqual(start["status"], 201)
+        self.assertIn((b"content-type", b"application/json"), start["headers"])
+        self.assertEqual(body["body"], b'{"ok":true}')
+
+    async def test_backend_from_container(self) -> None:
+        class Upper(JsonBackend):
+            def dumps(self, value):
+                return super().dumps(value).upper()
+
+        upper = Application(Path("."), [HttpModule()])
+        upper.singleton(JsonBackend, Upper)
+        plain = Application(Path("."), [HttpModule()])
+
+        async def handler(request: Request) -> JSONResponse:
+            return JSONResponse({"ok": True})
+
+        for app in (upper, plain):
+            app.boot()
+            app[HttpKernel].handler = handler
+
+        bodies = []
+        for app in (upper, plain):
+            send = AsyncMock()
+            await app(http_scope(), receiving(b""), send)
+            bodies.append(send.call_args_list[1].args[0]["body"])
+        self.assertEqual(bodies, [b'{"OK":TRUE}', b'{"ok":true}'])
@@ -0,0 +1,91 @@
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from ciel import Application
+from ciel.http import HttpModule, HttpKernel, Request, Response, StreamingResponse
+from ..asgi import http_scope
+
+
+class TestHttpKernel(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.app = Application(Path("."), [HttpModule()])
+        self.app.boot()
+        self.kernel = self.app[HttpKernel]
+        self.receive = AsyncMock(return_value={"type": "http.request", "body": b"ping", "more_body": False})
+
+    async def test_not_found_by_default(self) -> None:
+        send = AsyncMock()
+        await self.app(http_scope(), self.receive, send)
+
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 404)
+        self.assertEqual(send.call_args_list[1].args[0]["body"], b"Not Found")
+
+    async def test_handler(self) -> None:
+        async def handler(request: Request) -> Response:
+            response = Response()
+            response.body = await request.read() + b" " + request.path.encode()
+            return response
+
+        self.kernel.handler = handler
+        send = AsyncMock()
+        await self.app(http_scope("/pong"), self.receive, send)
+
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 200)
+        self.assertEqual(send.call_args_list[1].args[0]["body"], b"ping /pong")
+
+    async def test_request_bound_in_scope(self) -> None:
+        seen = []
+
+        async def handler(request: Request) -> Response:
+            seen.append(self.app[Request])
+            return Response()
+
+        self.kernel.handler = handler
+        await self.app(http_scope(), self.receive, AsyncMock())
+
+        self.assertIsInstance(seen[0], Request)
+        with self.assertRaises(RuntimeError):
+            self.app.make(Request)
+
+    async def test_payload_too_large(self) -> None:
+        async def handler(request: Request) -> Response:
+            await request.read()
+            return Response()
+
+        self.kernel.handler = handler
+        self.kernel.max_body_size = 2
+        send = AsyncMock()
+        await self.app(http_scope(), self.receive, send)
+
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 413)
+
+    async def test_client_disconnect(self) -> None:
+        async def handler(request: Request) -> Response:
+            await request.read()
+            return Response()
+
+        self.kernel.handler = handler
+        send = AsyncMock()
+        await self.app(http_scope(), AsyncMock(return_value={"type": "http.disconnect"}), send)
+
+        send.assert_not_called()
+
+    async def test_streaming_within_scope(self) -> None:
+        async def chunks():
+            yield b"first "
+            yield self.app.make(Request).path.encode()
+
+        async def handler(request: Request) -> Response:
+            return StreamingResponse(chunks())
+
+        self.kernel.handler = handler
+        send = AsyncMock()
+        await self.app(http_scope("/stream"), self.receive, send)
+
+        self.assertEqual(b"".join(call.args[0].get("body", b"") for call in send.call_args_list[1:]), b"first /stream")
+
+    def test_freeze(self) -> None:
+        self.app.freeze()
+        self.assertIs(self.app[HttpKernel], self.kernel)
@@ -0,0 +1,81 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from ciel.http import StreamingResponse, FileResponse
+
+
+def events(send: AsyncMock) -> list[dict]:
+    return [call.args[0] for call in send.call_args_list]
+
+
+class TestStreamingResponse(unittest.IsolatedAsyncioTestCase):
+
+    async def test_async_iterator(self) -> None:
+        async def content():
+            yield b"Hello, "
+            yield ""
+            yield "World!"
+
+        send = AsyncMock()
+        await StreamingResponse(content(), content_type="text/plain").send(send)
+
+        sent = events(send)
+        self.assertEqual(sent[0]["type"], "http.response.start")
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual([(e["body"], e["more_body"]) for e in sent[1:]],
+                         [(b"Hello, ", True), (b"World!", True), (b"", False)])
+
+    async def test_sync_iterator(self) -> None:
+        send = AsyncMock()
+        await StreamingResponse(iter([b"a", b"b"]), status=201).send(send)
+
+        sent = events(send)
+        self.assertEqual(sent[0]["status"], 201)
+        self.assertEqual([e["body"] for e in sent[1:]], [b"a", b"b", b""])
+
+    async def test_backpressure(self) -> None:
+        produced = []
+
+        async def content():
+            for chunk in (b"1", b"2", b"3"):
+                produced.append(chunk)
+                yield chunk
+
+        async def send(event: dict) -> None:
+            if event["type"] == "http.response.body" and event["more_body"]:
+                # Nothing is produced ahead of what the server accepted.
+                self.assertEqual(produced[-1], event["body"])
+
+        await StreamingResponse(content()).send(send)
+        self.assertEqual(produced, [b"1", b"2", b"3"])
+
+
+class TestFileResponse(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "export.csv"
+        self.path.write_bytes(b"a,b\n" * 10)
+
+    async def test_chunks(self) -> None:
+        send = AsyncMock()
+        response = FileResponse(self.path, chunk_size=16)
+        await response.send(send, {})
+
+        sent = events(send)
+        self.assertEqual(response.headers["content-length"], "40")
+        self.assertEqual(response.headers["content-type"], "text/csv")
+        self.assertEqual(b"".join(e["body"] for e in sent[1:]), b"a,b\n" * 10)
+        self.assertEqual([len(e["body"]) for e in sent[1:]], [16, 16, 8, 0])
+        self.assertFalse(sent[-1]["more_body"])
+
+    async def test_pathsend(self) -> None:
+        send = AsyncMock()
+        await FileResponse(self.path).send(send, {"http.response.pathsend": {}})
+
+        sent = events(send)
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sent[1], {"type": "http.response.pathsend", "path": str(self.path.absolute())})
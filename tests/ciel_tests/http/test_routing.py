@@ -0,0 +1,147 @@
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+from ciel import Application
+from ciel.http import HttpModule, Request, Response, Router
+from ..asgi import http_scope
+
+
+class Greeter:
+    def greet(self, name: str) -> bytes:
+        return f"Hello {name}".encode()
+
+
+def text(body: bytes) -> Response:
+    response = Response()
+    response.body = body
+    return response
+
+
+class TestRouter(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.app = Application(Path("."), [HttpModule()])
+        self.app.singleton(Greeter)
+        self.router = self.app[Router]
+
+    def test_static(self) -> None:
+        route = self.router.add("get", "/users/me", text)
+        self.assertEqual(self.router.lookup("GET", "/users/me"), (route, {}))
+        self.assertEqual(self.router.lookup("GET", "/users"), (None, {}))
+        self.assertEqual(self.router.lookup("GET", "/users/me/"), (None, {}))
+        self.assertEqual(self.router.lookup("POST", "/users/me")[0], None)
+
+    def test_root(self) -> None:
+        route = self.router.add("GET", "/", text)
+        self.assertEqual(self.router.lookup("GET", "/"), (route, {}))
+
+    def test_typed_parameters(self) -> None:
+        by_id = self.router.add("GET", "/users/{id:int}", text)
+        by_uuid = self.router.add("GET", "/users/{uid:uuid}", text)
+        by_slug = self.router.add("GET", "/users/{slug:slug}", text)
+        by_name = self.router.add("GET", "/users/{name}", text)
+        uid = uuid4()
+
+        self.assertEqual(self.router.lookup("GET", "/users/42"), (by_id, {"id": 42}))
+        self.assertEqual(self.router.lookup("GET", f"/users/{uid}"), (by_uuid, {"uid": uid}))
+        for spelling in (uid.hex, f"{{{uid}}}", f"urn:uuid:{uid}", str(uid).upper()):
+            self.assertNotEqual(self.router.lookup("GET", f"/users/{spelling}")[0], by_uuid)
+        self.assertEqual(self.router.lookup("GET", "/users/jane-doe"), (by_slug, {"slug": "jane-doe"}))
+        self.assertEqual(self.router.lookup("GET", "/users/Jane Doe"), (by_name, {"name": "Jane Doe"}))
+        self.assertEqual(self.router.lookup("GET", "/users/"), (None, {}))
+
+    def test_static_before_parameters(self) -> None:
+        me = self.router.add("GET", "/users/me", text)
+        by_name = self.router.add("GET", "/users/{name}", text)
+        self.assertEqual(self.router.lookup("GET", "/users/me"), (me, {}))
+        self.assertEqual(self.router.lookup("GET", "/users/you"), (by_name, {"name": "you"}))
+
+    def test_backtracking(self) -> None:
+        posts = self.router.add("GET", "/users/{id:int}/posts", text)
+        files = self.router.add("GET", "/users/{name}/files", text)
+        self.assertEqual(self.router.lookup("GET", "/users/1/posts"), (posts, {"id": 1}))
+        self.assertEqual(self.router.lookup("GET", "/users/1/files"), (files, {"name": "1"}))
+
+    def test_invalid_routes(self) -> None:
+        self.router.add("GET", "/users", text)
+        with self.assertRaises(ValueError):
+            self.router.add("GET", "/users", text)
+        with self.assertRaises(ValueError):
+            self.router.add("GET", "users", text)
+        with self.assertRaises(ValueError):
+            self.router.add("GET", "/users/{id:float}", text)
+        with self.assertRaises(ValueError):
+            self.router.add("GET", "/users/{id", text)
+
+    async def test_dispatch(self) -> None:
+        @self.router.get("/hello/{name:slug}")
+        async def hello(name: str, greeter: Greeter, request: Request) -> Response:
+            return text(greeter.greet(name) + b" from " + request.path.encode())
+
+        send = AsyncMock()
+        await self.app(http_scope("/hello/world"), AsyncMock(), send)
+
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 200)
+        self.assertEqual(send.call_args_list[1].args[0]["body"], b"Hello world from /hello/world")
+
+    async def test_sync_endpoint(self) -> None:
+        @self.router.post("/items/{id:uuid}")
+        def show(id: UUID) -> Response:
+            return text(str(id).encode())
+
+        uid = uuid4()
+        send = AsyncMock()
+        await self.app(http_scope(f"/items/{uid}", "POST"), AsyncMock(), send)
+        self.assertEqual(send.call_args_list[1].args[0]["body"], str(uid).encode())
+
+    async def test_not_found(self) -> None:
+        send = AsyncMock()
+        await self.app(http_scope("/missing"), AsyncMock(), send)
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 404)
+
+    async def test_method_not_allowed(self) -> None:
+        self.router.add("GET", "/items", text)
+        self.router.add("POST", "/items", text)
+
+        send = AsyncMock()
+        await self.app(http_scope("/items", "DELETE"), AsyncMock(), send)
+        self.assertEqual(send.call_args_list[0].args[0]["status"], 405)
+
+    async def test_middleware(self) -> None:
+        calls = []
+
+        def tagging(tag: str):
+            def factory(handler):
+                async def middleware(request: Request) -> Response:
+                    calls.append(tag)
+                    response = await handler(request)
+                    response.headers["x-tag"] = tag
+                    return response
+                return middleware
+            return factory
+
+        def empty() -> Response:
+            return text(b"")
+
+        self.router.add("GET", "/admin/users", empty)
+        self.router.middleware(tagging("admin"), prefix="/admin")
+        self.router.middleware(tagging("global"))
+        self.router.add("GET", "/admin", empty)
+        self.router.add("GET", "/administrators", empty)
+
+        for path, expected in (
+                ("/admin/users", ["global", "admin"]),
+                ("/admin", ["global", "admin"]),
+                ("/administrators", ["global"]),
+                ("/missing", ["global"]),
+        ):
+            with self.subTest(path=path):
+                calls.clear()
+                send = AsyncMock()
+                await self.app(http_scope(path), AsyncMock(), send)
+                self.assertEqual(calls, expected)
+
+        self.assertIs(self.router.lookup("GET", "/administrators")[0].handler,
+                      self.router.lookup("GET", "/administrators")[0].endpoint_handler)